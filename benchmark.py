@@ -0,0 +1,454 @@
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+import intseq
+
+WAVE_TYPES = [ "sine", "cosine", "tangent", "cotangent", "sawtooth", "triangle", "sigmoid", "square" ]
+
+def reference_wave( type, length, amplitude, frequency, phase_offset, vertical_offset, slope, duty_cycle ):
+    # The per-sample IntSeqWave generator from before vectorization, kept as the comparison baseline
+    values = []
+    phase_rad = math.radians( phase_offset )
+
+    for i in range( length ):
+        t = ( i / length ) * ( 2 * math.pi * frequency ) + phase_rad
+
+        if type == "sine":
+            value = amplitude * math.sin( t ) + vertical_offset
+        elif type == "cosine":
+            value = amplitude * math.cos( t ) + vertical_offset
+        elif type == "tangent":
+            value = amplitude * math.atan( math.tan( t ) ) * ( 2 / math.pi ) + vertical_offset
+        elif type == "cotangent":
+            try:
+                value = amplitude * math.atan( 1 / math.tan( t ) ) * ( 2 / math.pi ) + vertical_offset
+            except ZeroDivisionError:
+                value = float( 'nan' )
+        elif type == "sawtooth":
+            normalized_t = ( t / ( 2 * math.pi ) ) % 1
+            if normalized_t < duty_cycle:
+                value = amplitude * ( normalized_t / duty_cycle ) - amplitude / 2
+            else:
+                value = amplitude * ( ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) ) - amplitude / 2
+            value += vertical_offset
+        elif type == "triangle":
+            normalized_t = ( t / ( 2 * math.pi ) ) % 1
+            if normalized_t < duty_cycle:
+                value = amplitude * ( 2 * normalized_t / duty_cycle - 1 )
+            else:
+                value = amplitude * ( 1 - 2 * ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) )
+            value += vertical_offset
+        elif type == "sigmoid":
+            sigmoid_input = intseq.remap( t, 0, 2 * math.pi * frequency, -6 * frequency, 6 * frequency ) * slope
+            value = amplitude * ( 1 / ( 1 + math.exp( -sigmoid_input ) ) ) + vertical_offset - amplitude / 2
+        elif type == "square":
+            normalized_t = ( t / ( 2 * math.pi ) ) % 1
+            value = amplitude + vertical_offset if normalized_t < duty_cycle else -amplitude + vertical_offset
+        else:
+            value = 0
+
+        values.append( value )
+
+    values = [ v if not math.isnan( v ) else 0 for v in values ]
+    return ",".join( map( str, values ) )
+
+def disable_caches( ):
+    # Repeats and worker counts would otherwise be result cache hits, since workers is not part of
+    # the key. The parse cache is cleared before each timed call instead.
+    intseq.RESULT_CACHE.memory_bytes = 0
+    intseq.RESULT_CACHE.directory = None
+
+def time_call( fn, *args, repeat=3 ):
+    best = float( "inf" )
+    for _ in range( repeat ):
+        intseq.PARSE_CACHE.clear( )
+        start = time.perf_counter( )
+        fn( *args )
+        best = min( best, time.perf_counter( ) - start )
+    return best
+
+def bench_waves( length, repeat ):
+    node = intseq.IntSeqWave( )
+    print( f"IntSeqWave, {length:,} samples (best of {repeat})" )
+    # "array" is the vectorized generator alone; "node" adds the STRING output that the old code also built
+    print( f"{'type':<10} {'old samples/s':>16} {'array samples/s':>16} {'node samples/s':>16} {'speedup':>9}" )
+    for wave_type in WAVE_TYPES:
+        args = ( wave_type, length, 1.0, 4.0, 0.0, 0.0, 1.0, 0.5 )
+        old = time_call( reference_wave, *args, repeat=repeat )
+        array = time_call( intseq.wave_values, *args, repeat=repeat )
+        new = time_call( node.generate_wave_sequence, *args, repeat=repeat )
+        print( f"{wave_type:<10} {length / old:>16,.0f} {length / array:>16,.0f} {length / new:>16,.0f} {old / array:>8.1f}x" )
+
+IMAGE_METHODS = [ "RGB", "cellular automaton", "meander", "angle and length", "run and turn" ]
+
+def peak_rss_mb( ):
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+    return peak / ( 1 << 20 if sys.platform == "darwin" else 1 << 10 )
+
+def legacy_image( size ):
+    # The old output path: a full PIL image, copied to uint8, converted to float32, then wrapped
+    outimage = Image.new( "RGB", ( size, size ) )
+    return intseq.conv_pil_tensor( outimage )
+
+def render_case( case, size, line_width, workers=1 ):
+    sequence = ",".join( str( ( i * 37 ) % 256 ) for i in range( 20000 ) )
+    if case == "legacy":
+        start = time.perf_counter( )
+        legacy_image( size )
+    else:
+        node = intseq.IntSeqImage( )
+        intseq.PARSE_CACHE.clear( )
+        start = time.perf_counter( )
+        node.generate_image( size, size, sequence, case, 30, 0, -1, -1, -1, -1, -1, -1, -1, -1, 1.0, 1.0, line_width, 0.5, 0.5, "wrap", workers=workers )
+    return time.perf_counter( ) - start
+
+def bench_memory( size, line_width ):
+    # Each case runs in a fresh interpreter, since peak RSS never goes back down within a process
+    output_mb = size * size * 3 * 4 / ( 1 << 20 )
+    print( f"IntSeqImage peak memory, {size}x{size}, line width {line_width} (float32 output alone is {output_mb:,.0f} MB)" )
+    print( f"{'method':<20} {'seconds':>9} {'base MB':>9} {'peak MB':>9} {'added MB':>9}" )
+    for case in [ "legacy" ] + IMAGE_METHODS:
+        child = subprocess.run( [ sys.executable, __file__, "memory-case", case, str( size ), str( line_width ) ], capture_output=True, text=True, check=True )
+        row = json.loads( child.stdout )
+        print( f"{case:<20} {row[ 'seconds' ]:>9.2f} {row[ 'base' ]:>9,.0f} {row[ 'peak' ]:>9,.0f} {row[ 'peak' ] - row[ 'base' ]:>9,.0f}" )
+
+def memory_case( case, size, line_width ):
+    base = peak_rss_mb( )
+    seconds = render_case( case, size, line_width )
+    print( json.dumps( { "seconds": seconds, "base": base, "peak": peak_rss_mb( ) } ) )
+
+def bench_workers( size, line_width, counts, repeat ):
+    print( f"IntSeqImage render time, {size}x{size}, line width {line_width} (best of {repeat}, {os.cpu_count( )} cores)" )
+    print( f"{'method':<20}" + "".join( f"{f'{count} workers':>12}" for count in counts ) )
+    for method in IMAGE_METHODS:
+        times = [ min( render_case( method, size, line_width, count ) for _ in range( repeat ) ) for count in counts ]
+        print( f"{method:<20}" + "".join( f"{t:>11.2f}s" for t in times ) )
+
+def reference_plot( values ):
+    # The pyplot and PNG round trip IntSeqPlotter used before the Agg renderer
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots( )
+    ax.plot( values )
+    ax.grid( True )
+    buf = io.BytesIO( )
+    plt.savefig( buf, format='png' )
+    plt.close( fig )
+    buf.seek( 0 )
+    image = Image.open( buf ).convert( "RGB" )
+    return torch.from_numpy( np.array( image ).astype( np.float32 ) / 255.0 ).unsqueeze( 0 )
+
+def bench_plots( lengths, repeat ):
+    node = intseq.IntSeqPlotter( )
+    print( f"IntSeqPlotter (best of {repeat})" )
+    print( f"{'values':>12} {'pyplot + PNG':>14} {'Agg':>10} {'fast':>10}" )
+    for length in lengths:
+        values = np.cumsum( np.random.default_rng( 0 ).normal( size=length ) )
+        old = time_call( reference_plot, values, repeat=repeat )
+        agg = time_call( lambda: node.plot_sequence( "", "", "", "", intseq=values ), repeat=repeat )
+        fast = time_call( lambda: node.plot_sequence( "", "", "", "", intseq=values, renderer="fast" ), repeat=repeat )
+        print( f"{length:>12,} {old:>13.3f}s {agg:>9.3f}s {fast:>9.3f}s" )
+
+# --- Suite: every node across a grid of sizes and lengths ---
+
+BOUNDARIES = [ "clamp", "wrap", "bounce", "none" ]
+CA_RULES = [ 30, 90, 110, 184 ]
+
+class PeakMemory:
+    # Peak RSS of one case. On Linux, writing 5 to clear_refs resets VmHWM, so the peak is measured
+    # from the start of each case; elsewhere tracemalloc is the fallback, which sees NumPy and
+    # Python allocations but not torch's.
+    def __init__( self ):
+        self.proc = os.path.exists( "/proc/self/clear_refs" )
+
+    @staticmethod
+    def status( field ):
+        with open( "/proc/self/status" ) as status:
+            for line in status:
+                if line.startswith( field ):
+                    return int( line.split( )[ 1 ] ) / 1024
+
+    def start( self ):
+        if self.proc:
+            try:
+                with open( "/proc/self/clear_refs", "w" ) as clear:
+                    clear.write( "5" )
+                self.base = self.status( "VmRSS" )
+                return
+            except OSError:
+                self.proc = False
+        import tracemalloc
+        tracemalloc.start( )
+        tracemalloc.reset_peak( )
+
+    def stop( self ):
+        if self.proc:
+            return self.status( "VmHWM" ) - self.base
+        import tracemalloc
+        peak = tracemalloc.get_traced_memory( )[ 1 ] / ( 1 << 20 )
+        tracemalloc.stop( )
+        return peak
+
+def sample_sequence( length ):
+    return ",".join( map( str, np.random.default_rng( length ).integers( 0, 256, length ).tolist( ) ) )
+
+def image_cases( sizes, lengths ):
+    node = intseq.IntSeqImage( )
+    cases = []
+    for size in sizes:
+        for length in lengths:
+            sequence = sample_sequence( length )
+            variants = [ ( "RGB", {}, "" ) ]
+            variants += [ ( "cellular automaton", { "rule": rule }, f" rule {rule}" ) for rule in CA_RULES ]
+            variants += [ ( method, { "boundary_behavior": boundary }, f" {boundary}" ) for method in [ "meander", "angle and length", "run and turn" ] for boundary in BOUNDARIES ]
+            for method, extra, label in variants:
+                params = dict( width=size, height=size, sequence=sequence, method=method, rule=30, color_offset=0.33, value_min=-1, value_max=-1, red_min=-1, red_max=-1, green_min=-1, green_max=-1, blue_min=-1, blue_max=-1, angle_scale=1.0, length_scale=5.0, line_width=1, start_x=size // 2, start_y=size // 2, boundary_behavior="clamp" )
+                params.update( extra )
+                cases.append( dict( node="IntSeqImage", name=f"IntSeqImage {method}{label} {size}px {length}v", params=dict( method=method, size=size, length=length, **extra ), units=size * size, unit="pixels", run=lambda params=params: node.generate_image( **params ) ) )
+    return cases
+
+AUTOMATA = [ ( "life-like 2D", "B3/S23", 2, 1 ), ( "life-like 2D", "B34-45/S33-57", 2, 5 ), ( "life-like 2D", "B300-400/S280-500", 2, 16 ), ( "totalistic 1D", "1599", 3, 1 ), ( "totalistic 1D", "150", 2, 3 ) ]
+
+def automaton_cases( sizes, lengths ):
+    node = intseq.IntSeqAutomaton( )
+    cases = []
+    for size in sizes:
+        for method, rule, states, radius in AUTOMATA:
+            for render in [ "state", "age" ]:
+                params = dict( width=size, height=size, sequence=sample_sequence( 997 ), method=method, rule=rule, states=states, radius=radius, generations=100, render=render, red_min=0, red_max=255, green_min=0, green_max=255, blue_min=0, blue_max=255 )
+                # 2D work grows with the generations as well as the grid
+                units = size * size * ( 100 if method == "life-like 2D" else 1 )
+                cases.append( dict( node="IntSeqAutomaton", name=f"IntSeqAutomaton {method} {rule} {render} {size}px", params=dict( method=method, rule=rule, render=render, size=size ), units=units, unit="cells", run=lambda params=params: node.generate_automaton( **params ) ) )
+    return cases
+
+def sigmas_cases( sizes, lengths ):
+    node = intseq.IntSeqSigmas( )
+    return [ dict( node="IntSeqSigmas", name=f"IntSeqSigmas {order} {length}v", params=dict( sort_order=order, length=length ), units=length, unit="samples", run=lambda sequence=sample_sequence( length ), order=order: node.map_sequence( sequence, 0, 0.0, 20.0, True, order ) ) for length in lengths for order in [ "no sort", "highest to lowest" ] ] + [
+        dict( node="IntSeqSigmas", name=f"IntSeqSigmas {mode} 30 steps {length}v", params=dict( resample=mode, steps=30, length=length ), units=length, unit="samples", run=lambda values=np.random.default_rng( 0 ).random( length ), mode=mode: node.map_sequence( "", 0, 0.0, 20.0, True, "no sort", intseq=values, steps=30, resample=mode ) ) for length in lengths for mode in [ "linear", "cubic", "percentile" ] ]
+
+def sigmas_to_intseq_cases( sizes, lengths ):
+    node = intseq.SigmasToIntSeq( )
+    return [ dict( node="SigmasToIntSeq", name=f"SigmasToIntSeq {length}v", params=dict( length=length ), units=length, unit="samples", run=lambda sigmas=torch.linspace( 20.0, 0.0, length ): node.convert_to_sequence( sigmas ) ) for length in lengths ]
+
+def plotter_cases( sizes, lengths ):
+    node = intseq.IntSeqPlotter( )
+    return [ dict( node="IntSeqPlotter", name=f"IntSeqPlotter {renderer} {length}v", params=dict( renderer=renderer, length=length ), units=length, unit="samples", run=lambda sequence=sample_sequence( length ), renderer=renderer: node.plot_sequence( sequence, "Sequence Plot", "Index", "Value", renderer=renderer ) ) for length in lengths for renderer in [ "matplotlib", "fast" ] ]
+
+def wave_cases( sizes, lengths ):
+    node = intseq.IntSeqWave( )
+    return [ dict( node="IntSeqWave", name=f"IntSeqWave {wave_type} {length}v", params=dict( type=wave_type, length=length ), units=length, unit="samples", run=lambda wave_type=wave_type, length=length: node.generate_wave_sequence( wave_type, length, 1.0, 4.0, 0.0, 0.0, 1.0, 0.5 ) ) for length in lengths for wave_type in WAVE_TYPES ]
+
+def cache_stats_cases( sizes, lengths ):
+    node = intseq.IntSeqCacheStats( )
+    return [ dict( node="IntSeqCacheStats", name="IntSeqCacheStats", params={}, units=1, unit="calls", run=lambda: node.cache_stats( False ) ) ]
+
+def loader_cases( sizes, lengths ):
+    node = intseq.IntSeqLoader( )
+    folder = tempfile.mkdtemp( prefix="intseq-bench-" )
+    cases = []
+    for length in lengths:
+        values = np.random.default_rng( length ).integers( 0, 1 << 40, length )
+        text = os.path.join( folder, f"{length}.txt" )
+        with open( text, "w" ) as file:
+            file.write( "\n".join( map( str, values.tolist( ) ) ) )
+        binary = os.path.join( folder, f"{length}.npy" )
+        np.save( binary, values )
+        for format, path in [ ( "text", text ), ( "npy", binary ) ]:
+            # Summing forces the memory-mapped pages to be read
+            cases.append( dict( node="IntSeqLoader", name=f"IntSeqLoader {format} {length}v", params=dict( format=format, length=length ), units=length, unit="samples", run=lambda path=path: node.load_sequence( path, "auto", 0, 0, -1 )[ 0 ].sum( ) ) )
+    return cases
+
+def generator_cases( sizes, lengths ):
+    node = intseq.IntSeqGenerator( )
+    cases = []
+    for length in lengths:
+        for kind in intseq.GENERATORS:
+            count = min( length, intseq.DIGIT_LIMIT ) if kind == "digits" else length
+            cases.append( dict( node="IntSeqGenerator", name=f"IntSeqGenerator {kind} {count}v", params=dict( kind=kind, length=count ), units=count, unit="samples", run=lambda kind=kind, count=count: node.generate_sequence( kind, 0, count, modulus=1000000007, format_text=False ) ) )
+    return cases
+
+SUITE_CASES = {
+    "IntSeqImage": image_cases,
+    "IntSeqAutomaton": automaton_cases,
+    "IntSeqSigmas": sigmas_cases,
+    "SigmasToIntSeq": sigmas_to_intseq_cases,
+    "IntSeqPlotter": plotter_cases,
+    "IntSeqWave": wave_cases,
+    "IntSeqCacheStats": cache_stats_cases,
+    "IntSeqLoader": loader_cases,
+    "IntSeqGenerator": generator_cases,
+}
+
+def suite_cases( nodes, sizes, lengths ):
+    cases = []
+    for name in intseq.NODE_CLASS_MAPPINGS:
+        if nodes and name not in nodes:
+            continue
+        if name not in SUITE_CASES:
+            print( f"Warning: no benchmark cases for {name}" )
+            continue
+        cases += SUITE_CASES[ name ]( sizes, lengths )
+    return cases
+
+def run_case( case, repeat, memory ):
+    # The result cache is off and the parse cache is cleared, so times cover the whole node call
+    times = []
+    peak = 0.0
+    for _ in range( repeat ):
+        intseq.PARSE_CACHE.clear( )
+        memory.start( )
+        start = time.perf_counter( )
+        case[ "run" ]( )
+        times.append( time.perf_counter( ) - start )
+        peak = max( peak, memory.stop( ) )
+    best = min( times )
+    return dict( node=case[ "node" ], name=case[ "name" ], params=case[ "params" ], unit=case[ "unit" ], units=case[ "units" ], first=times[ 0 ], best=best, throughput=case[ "units" ] / best if best else None, peak_mb=peak )
+
+def profile_nodes( cases, profiler, directory ):
+    # One profile per node over all of its cases, written to directory, with the top entries printed
+    os.makedirs( directory, exist_ok=True )
+    for node in dict.fromkeys( case[ "node" ] for case in cases ):
+        node_cases = [ case for case in cases if case[ "node" ] == node ]
+        if profiler == "pyinstrument":
+            from pyinstrument import Profiler
+            profile = Profiler( )
+            profile.start( )
+            for case in node_cases:
+                case[ "run" ]( )
+            profile.stop( )
+            path = os.path.join( directory, f"{node}.txt" )
+            with open( path, "w" ) as file:
+                file.write( profile.output_text( ) )
+            print( f"\n{node}: {path}" )
+            print( "\n".join( profile.output_text( ).splitlines( )[ :25 ] ) )
+        else:
+            import cProfile
+            import pstats
+            profile = cProfile.Profile( )
+            profile.enable( )
+            for case in node_cases:
+                case[ "run" ]( )
+            profile.disable( )
+            path = os.path.join( directory, f"{node}.prof" )
+            profile.dump_stats( path )
+            print( f"\n{node}: {path}" )
+            pstats.Stats( profile ).sort_stats( "tottime" ).print_stats( 12 )
+
+def bench_suite( nodes, sizes, lengths, repeat, output, profiler, profile_dir ):
+    cases = suite_cases( nodes, sizes, lengths )
+    memory = PeakMemory( )
+    results = []
+    print( f"{'case':<58} {'first':>9} {'best':>9} {'throughput':>22} {'peak MB':>9}" )
+    for case in cases:
+        row = run_case( case, repeat, memory )
+        results.append( row )
+        rate = f"{row[ 'throughput' ]:,.0f} {row[ 'unit' ]}/s" if row[ 'throughput' ] else "-"
+        print( f"{row[ 'name' ][ :58 ]:<58} {row[ 'first' ]:>8.3f}s {row[ 'best' ]:>8.3f}s {rate:>22} {row[ 'peak_mb' ]:>9,.1f}" )
+
+    if output:
+        meta = dict( created=time.strftime( "%Y-%m-%dT%H:%M:%S" ), python=platform.python_version( ), numpy=np.__version__, torch=torch.__version__, platform=platform.platform( ), cpus=os.cpu_count( ), repeat=repeat, sizes=sizes, lengths=lengths )
+        with open( output, "w" ) as file:
+            json.dump( dict( meta=meta, results=results ), file, indent=2 )
+        print( f"Wrote {len( results )} results to {output}" )
+    if profiler:
+        profile_nodes( cases, profiler, profile_dir )
+
+def compare_results( baseline, current, threshold ):
+    # Compares best times case by case; exits non-zero when any case got slower than threshold
+    with open( baseline ) as file:
+        old = { row[ "name" ]: row for row in json.load( file )[ "results" ] }
+    with open( current ) as file:
+        new = { row[ "name" ]: row for row in json.load( file )[ "results" ] }
+    regressions = 0
+    print( f"{'case':<58} {'before':>9} {'after':>9} {'change':>8}" )
+    for name, row in new.items( ):
+        if name not in old:
+            print( f"{name[ :58 ]:<58} {'-':>9} {row[ 'best' ]:>8.3f}s {'new':>8}" )
+            continue
+        change = row[ "best" ] / old[ name ][ "best" ] - 1 if old[ name ][ "best" ] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions += 1
+            flag = "  slower"
+        elif change < -threshold:
+            flag = "  faster"
+        print( f"{name[ :58 ]:<58} {old[ name ][ 'best' ]:>8.3f}s {row[ 'best' ]:>8.3f}s {change:>+7.0%}{flag}" )
+    for name in sorted( old.keys( ) - new.keys( ) ):
+        print( f"{name[ :58 ]:<58} {old[ name ][ 'best' ]:>8.3f}s {'-':>9} {'gone':>8}" )
+    print( f"{regressions} case(s) slower by more than {threshold:.0%}" )
+    return 1 if regressions else 0
+
+def main( ):
+    parser = argparse.ArgumentParser( description="IntSeq node benchmarks, run without a ComfyUI server" )
+    commands = parser.add_subparsers( dest="command", required=True )
+
+    waves = commands.add_parser( "waves", help="Compare the scalar and vectorized IntSeqWave generators" )
+    waves.add_argument( "--length", type=int, default=100000 )
+    waves.add_argument( "--repeat", type=int, default=3 )
+
+    memory = commands.add_parser( "memory", help="Report peak RSS of IntSeqImage for each method" )
+    memory.add_argument( "--size", type=int, default=8192 )
+    memory.add_argument( "--line-width", type=int, default=1 )
+
+    workers = commands.add_parser( "workers", help="Time IntSeqImage for each method at several worker counts" )
+    workers.add_argument( "--size", type=int, default=4096 )
+    workers.add_argument( "--line-width", type=int, default=1 )
+    workers.add_argument( "--counts", default="1,2,4,8" )
+    workers.add_argument( "--repeat", type=int, default=3 )
+
+    plots = commands.add_parser( "plots", help="Compare the pyplot round trip with the Agg and fast plot renderers" )
+    plots.add_argument( "--lengths", default="1000,100000,1000000" )
+    plots.add_argument( "--repeat", type=int, default=3 )
+
+    suite = commands.add_parser( "suite", help="Time every node and IntSeqImage method over a grid of sizes and lengths" )
+    suite.add_argument( "--nodes", default="", help="Comma-separated node names (default: all)" )
+    suite.add_argument( "--sizes", default="512,2048", help="IntSeqImage widths and heights" )
+    suite.add_argument( "--lengths", default="1000,100000", help="Sequence lengths" )
+    suite.add_argument( "--repeat", type=int, default=3 )
+    suite.add_argument( "--output", help="Write the results as JSON to this file" )
+    suite.add_argument( "--profile", choices=[ "cprofile", "pyinstrument" ], help="Also profile each node and print its hot spots" )
+    suite.add_argument( "--profile-dir", default="profiles" )
+
+    compare = commands.add_parser( "compare", help="Compare two suite JSON files and flag regressions" )
+    compare.add_argument( "baseline" )
+    compare.add_argument( "current" )
+    compare.add_argument( "--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression" )
+
+    # Internal: one measurement inside a fresh process, used by "memory"
+    case = commands.add_parser( "memory-case" )
+    case.add_argument( "case" )
+    case.add_argument( "size", type=int )
+    case.add_argument( "line_width", type=int )
+
+    args = parser.parse_args( )
+    disable_caches( )
+    if args.command == "waves":
+        bench_waves( args.length, args.repeat )
+    elif args.command == "memory":
+        bench_memory( args.size, args.line_width )
+    elif args.command == "workers":
+        bench_workers( args.size, args.line_width, [ int( c ) for c in args.counts.split( "," ) ], args.repeat )
+    elif args.command == "plots":
+        bench_plots( [ int( n ) for n in args.lengths.split( "," ) ], args.repeat )
+    elif args.command == "suite":
+        bench_suite( [ n for n in args.nodes.split( "," ) if n ], [ int( n ) for n in args.sizes.split( "," ) ], [ int( n ) for n in args.lengths.split( "," ) ], args.repeat, args.output, args.profile, args.profile_dir )
+    elif args.command == "compare":
+        sys.exit( compare_results( args.baseline, args.current, args.threshold ) )
+    elif args.command == "memory-case":
+        memory_case( args.case, args.size, args.line_width )
+
+if __name__ == "__main__":
+    main( )
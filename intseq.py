@@ -2,10 +2,23 @@ from PIL import Image, ImageDraw
 import copy
 import torch
 import numpy as np
-import matplotlib.pyplot as plt
-import io
 import math
 import random
+import re
+import string
+import warnings
+import functools
+import os
+import collections
+import array
+import decimal
+import hashlib
+import inspect
+import json
+import threading
+import time
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 def remap( val, min_val, max_val, min_map, max_map ):
     if max_val == min_val:
@@ -13,11 +26,825 @@ def remap( val, min_val, max_val, min_map, max_map ):
     return ( val - min_val ) / ( max_val - min_val ) * ( max_map - min_map ) + min_map
     
 def conv_pil_tensor( img ):
-    return ( torch.from_numpy( np.array( img ).astype( np.float32 ) / 255.0 ).unsqueeze( 0 ), )
+    return ( torch.from_numpy( unit_float( np.array( img ) ) ).unsqueeze( 0 ), )
+
+def unit_float( arr ):
+    return arr.astype( np.float32 ) / 255.0
+
+# Images are converted to float in bands of about this many pixels, so no full-size temporary is needed
+BAND_PIXELS = 1 << 20
+
+def band_rows( width ):
+    return max( 1, BAND_PIXELS // width )
+
+def resolve_workers( workers ):
+    return ( os.cpu_count( ) or 1 ) if workers == 0 else max( 1, workers )
+
+@functools.lru_cache( maxsize=4 )
+def thread_pool( workers ):
+    return ThreadPoolExecutor( max_workers=workers, thread_name_prefix="intseq" )
+
+def parallel_map( fn, items, workers=1 ):
+    # Ordered map over a shared thread pool, with at most two jobs per worker in flight. The jobs
+    # are NumPy and PIL kernels that release the GIL; with one worker everything runs inline.
+    if workers <= 1:
+        yield from map( fn, items )
+        return
+    pool = thread_pool( workers )
+    pending = collections.deque( )
+    for item in items:
+        pending.append( pool.submit( fn, item ) )
+        if len( pending ) >= 2 * workers:
+            yield pending.popleft( ).result( )
+    while pending:
+        yield pending.popleft( ).result( )
+
+def run_parallel( fn, items, workers=1 ):
+    for _ in parallel_map( fn, items, workers ):
+        pass
+
+def split_range( total, parts, minimum=1 ):
+    # ( start, stop ) pairs covering range( total ) in at most parts pieces of at least minimum items
+    step = max( minimum, -( -total // max( parts, 1 ) ) )
+    return [ ( start, min( start + step, total ) ) for start in range( 0, total, step ) ]
+
+def tile_pixels( pixels, table, start, stop ):
+    # pixels[ start:stop ] as if table were repeated from pixel 0: one copy of the table, then the
+    # copied span doubles, so no index array is needed
+    band = pixels[ start:stop ]
+    phase = start % len( table )
+    seed = min( len( table ), len( band ) )
+    first = min( len( table ) - phase, seed )
+    band[ :first ] = table[ phase:phase + first ]
+    band[ first:seed ] = table[ :seed - first ]
+    done = seed
+    while done < len( band ):
+        span = min( done, len( band ) - done )
+        band[ done:done + span ] = band[ :span ]
+        done += span
+
+# Interior empty fields, which np.fromstring silently reads as -1
+EMPTY_FIELD = re.compile( r',\s*,' )
+
+class ParseCache:
+    # Parsed sequences keyed by their text, in an LRU bounded by the bytes of the text and the array
+    # together. Sequences too large to fit a quarter of the budget are parsed on every call instead.
+    def __init__( self, max_bytes ):
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict( )
+        self.size = 0
+        self.lock = threading.Lock( )
+
+    def get_or_parse( self, sequence, parse ):
+        with self.lock:
+            entry = self.entries.get( sequence )
+            if entry is not None:
+                self.entries.move_to_end( sequence )
+                return entry[ 0 ]
+        values = parse( sequence )
+        size = len( sequence ) + values.nbytes
+        if size * 4 > self.max_bytes:
+            return values
+        with self.lock:
+            if sequence not in self.entries:
+                self.entries[ sequence ] = ( values, size )
+                self.size += size
+                while self.size > self.max_bytes:
+                    _, ( _, evicted ) = self.entries.popitem( last=False )
+                    self.size -= evicted
+        return values
+
+    def clear( self ):
+        with self.lock:
+            self.entries.clear( )
+            self.size = 0
+
+PARSE_CACHE = ParseCache( 64 << 20 )
+
+def parse_values( sequence ):
+    return PARSE_CACHE.get_or_parse( sequence, read_values )
+
+def read_values( sequence ):
+    body = sequence.strip( string.whitespace + ',' )
+    values = None
+    if body and not EMPTY_FIELD.search( body ):
+        with warnings.catch_warnings( ):
+            warnings.simplefilter( "error" )
+            try:
+                values = np.fromstring( body, dtype=np.float64, sep=',' )
+            except ( ValueError, DeprecationWarning ):
+                values = None
+    if values is None:
+        values = np.array( [ float( x.strip() ) for x in body.split( ',' ) if x.strip() ], dtype=np.float64 )
+    # Shared between every caller of the parse cache, so it must never be modified in place
+    values.flags.writeable = False
+    return values
+
+def sequence_values( sequence, intseq=None, limit=None ):
+    # limit trims an INTSEQ before conversion, so a memory-mapped one is only read as far as needed
+    if intseq is not None:
+        return np.asarray( intseq.reshape( -1 )[ :limit ] if isinstance( intseq, np.ndarray ) else intseq, dtype=np.float64 ).ravel( )[ :limit ]
+    return parse_values( sequence )
+
+def format_values( values, separator="," ):
+    # Integer arrays are written as integers, anything else as floats
+    values = np.asarray( values )
+    if values.dtype.kind not in "iu":
+        values = values.astype( np.float64 )
+    return separator.join( map( str, values.tolist( ) ) )
 
 def clamp( val, min_val, max_val ):
     return max( min_val, min( val, max_val ) )
 
+def clamp_array( vals, min_val, max_val ):
+    # Same ordering as clamp( ), including NaN collapsing to min_val
+    clamped = np.maximum( min_val, np.minimum( vals, max_val ) )
+    clamped[ np.isnan( vals ) ] = min_val
+    return clamped
+
+def map_colors( values, color_offset, lv, mv, lr, mr, lg, mg, lb, mb ):
+    nv = clamp_array( np.asarray( values, dtype=np.float64 ), lv, mv )
+    channels = (
+        remap( nv, lv, mv, lr, mr ),
+        remap( ( nv + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ),
+        remap( ( nv + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ),
+    )
+    # int( ) truncation followed by the 0-255 clipping putpixel applies
+    colors = np.empty( nv.shape + ( 3, ), dtype=np.uint8 )
+    for c, channel in enumerate( channels ):
+        colors[ ..., c ] = np.clip( np.trunc( channel ), 0, 255 )
+    return colors
+
+def automaton_seed( values, width, states=2 ):
+    values = np.asarray( values, dtype=np.float64 )
+    row = remap( np.resize( values, width ), values.min( ), values.max( ), 0, states - 0.01 )
+    return ( np.trunc( np.broadcast_to( row, ( width, ) ) ).astype( np.int64 ) % states ).astype( np.uint8 )
+
+def run_automaton( rows, rules, height, band ):
+    # Yields ( first_row, generations ) for blocks of up to band generations, each shaped
+    # ( batch, rows, width ). The block buffer is reused, so consume it before the next one.
+    # Bit n of a rule is the next state for the neighbourhood pattern left * 4 + center * 2 + right.
+    luts = ( ( np.asarray( rules )[ :, None ] >> np.arange( 8 ) ) & 1 ).astype( np.uint8 ).ravel( )
+    lut_base = ( np.arange( rows.shape[ 0 ] ) * 8 )[ :, None ]
+    block = np.empty( ( rows.shape[ 0 ], min( band, height ), rows.shape[ 1 ] ), dtype=np.uint8 )
+    current = rows
+    for y0 in range( 0, height, band ):
+        count = min( band, height - y0 )
+        for y in range( count ):
+            if y0 + y:
+                pattern = ( np.roll( current, 1, axis=1 ) << 2 ) | ( current << 1 ) | np.roll( current, -1, axis=1 )
+                current = luts[ pattern + lut_base ]
+            block[ :, y ] = current
+        yield y0, block[ :, :count ]
+
+def walk_starts( steps, start, size, boundary_behavior ):
+    # Start point of every segment along one axis. Clamp and wrap fold each end point back in before
+    # the next step, which makes them sequential; the loops are kept to plain float arithmetic.
+    if not steps.size:
+        return np.empty( 0, dtype=np.float64 )
+    if boundary_behavior not in ( "clamp", "wrap" ):
+        return np.cumsum( np.concatenate( ( [ start ], steps ) ) )[ :-1 ]
+    starts = [ start ]
+    position = start
+    if boundary_behavior == "wrap":
+        for step in steps[ :-1 ].tolist( ):
+            position = ( position + step ) % size
+            starts.append( position )
+    else:
+        for step in steps[ :-1 ].tolist( ):
+            position = position + step
+            # Written out instead of calling clamp( ); "not >=" also sends NaN to 0 as clamp( ) does
+            if not position >= 0:
+                position = 0
+            elif position > size - 1:
+                position = size - 1
+            starts.append( position )
+    return np.array( starts, dtype=np.float64 )
+
+def bounce_segments( lengths, angles, cumulative, start_x, start_y, width, height ):
+    # A bounce reflects the heading used by every later segment, so this walk stays sequential
+    segments = []
+    x, y, heading = start_x, start_y, 0.0
+    for length, angle in zip( lengths.tolist( ), angles.tolist( ) ):
+        heading = heading + angle if cumulative else angle
+        rad_angle = math.radians( heading )
+        end_x = x + length * math.cos( rad_angle )
+        end_y = y + length * math.sin( rad_angle )
+        segments.append( ( x, y, end_x, end_y ) )
+
+        bounced = False
+        if end_x < 0 or end_x >= width:
+            heading = 180 - heading
+            bounced = True
+        if end_y < 0 or end_y >= height:
+            heading = 360 - heading
+            bounced = True
+        if bounced:
+            x = clamp( end_x, 0, width - 1 )
+            y = clamp( end_y, 0, height - 1 )
+        else:
+            x, y = end_x, end_y
+
+    return tuple( np.array( segments, dtype=np.float64 ).reshape( -1, 4 ).T )
+
+def turtle_segments( values, method, lv, mv, angle_scale, length_scale, start_x, start_y, width, height, boundary_behavior ):
+    values = np.asarray( values, dtype=np.float64 )
+    pairs = values.size // 2
+    lengths = values[ 0:2 * pairs:2 ] * length_scale
+    turns = values[ 1:2 * pairs:2 ] * angle_scale
+
+    if method == "angle and length":
+        # The heading accumulates every turn; colour follows the turn value
+        color_values = values[ 1:2 * pairs:2 ]
+        cumulative = True
+        angles = turns
+    else:
+        # Each segment has an absolute heading; colour follows the run value
+        color_values = values[ 0:2 * pairs:2 ]
+        cumulative = False
+        angles = np.broadcast_to( remap( turns, lv, mv, 0, 360 ), turns.shape )
+
+    if boundary_behavior == "bounce":
+        return bounce_segments( lengths, angles, cumulative, start_x, start_y, width, height ) + ( color_values, )
+
+    rad_angles = np.radians( np.cumsum( angles ) if cumulative else angles )
+    step_x = lengths * np.cos( rad_angles )
+    step_y = lengths * np.sin( rad_angles )
+    x0 = walk_starts( step_x, start_x, width, boundary_behavior )
+    y0 = walk_starts( step_y, start_y, height, boundary_behavior )
+    return x0, y0, x0 + step_x, y0 + step_y, color_values
+
+# PIL draws with C int end points. Segments with an end point past LINE_SAFE_LIMIT are clipped in
+# Python ints, as the products in line_steps( ) could overflow int64 for them.
+LINE_COORD_LIMIT = ( 1 << 31 ) - 1
+LINE_SAFE_LIMIT = 1 << 29
+
+def line_steps( ix0, iy0, ix1, iy1, finite, width, height ):
+    # Per segment: visible pixel count, Bresenham remainder at the first visible pixel, minor and
+    # major deltas, flat index of that pixel and the flat steps along each axis
+    dx = ix1 - ix0
+    dy = iy1 - iy0
+    major_x = np.abs( dx ) > np.abs( dy )
+
+    major_start = np.where( major_x, ix0, iy0 )
+    minor_start = np.where( major_x, iy0, ix0 )
+    major_step = np.where( np.where( major_x, dx, dy ) < 0, -1, 1 )
+    minor_step = np.where( np.where( major_x, dy, dx ) < 0, -1, 1 )
+    major_delta = np.abs( np.where( major_x, dx, dy ) )
+    minor_delta = np.abs( np.where( major_x, dy, dx ) )
+    major_size = np.where( major_x, width, height )
+    minor_size = np.where( major_x, height, width )
+    # A zero-length segment is a single point; any non-zero divisor gives minor offset 0 there
+    divisor = np.maximum( major_delta, 1 )
+
+    # Range of i that keeps the major axis on the image
+    lo = np.maximum( 0, np.where( major_step > 0, -major_start, major_start - major_size + 1 ) )
+    hi = np.minimum( major_delta, np.where( major_step > 0, major_size - 1 - major_start, major_start ) )
+
+    # Range of i that keeps the minor axis on the image, by inverting the rounding above
+    k_lo = np.where( minor_step > 0, -minor_start, minor_start - minor_size + 1 )
+    k_hi = np.where( minor_step > 0, minor_size - 1 - minor_start, minor_start )
+    sloped = minor_delta > 0
+    twice_minor = np.maximum( 2 * minor_delta, 1 )
+    lo = np.where( sloped, np.maximum( lo, -( ( divisor - 2 * divisor * k_lo ) // twice_minor ) ), lo )
+    hi = np.where( sloped, np.minimum( hi, -( ( divisor - 2 * divisor * ( k_hi + 1 ) ) // twice_minor ) - 1 ), hi )
+    off_image = ~sloped & ( ( k_lo > 0 ) | ( k_hi < 0 ) )
+    count = np.where( finite & ~off_image, np.maximum( hi - lo + 1, 0 ), 0 )
+
+    # Rebase every segment on its first visible pixel: from there the flat index advances by
+    # major_flat per step plus minor_flat each time the Bresenham quotient ticks over
+    numerator = 2 * minor_delta * lo + divisor
+    quotient = numerator // ( 2 * divisor )
+    remainder = numerator - quotient * 2 * divisor
+    major_lo = major_start + major_step * lo
+    minor_lo = minor_start + minor_step * quotient
+    flat_lo = np.where( major_x, minor_lo * width + major_lo, major_lo * width + minor_lo )
+    major_flat = np.where( major_x, major_step, major_step * width )
+    minor_flat = np.where( major_x, minor_step * width, minor_step )
+    return count, remainder, minor_delta, divisor, flat_lo, major_flat, minor_flat
+
+def line_pixel_chunks( x0, y0, x1, y1, width, height, budget=1 << 16, workers=1 ):
+    # Pixels of every segment as PIL's ImagingDrawLine plots them, clipped to the image and yielded
+    # in drawing order as ( segment, y * width + x ) chunks of roughly budget pixels. End points are
+    # truncated to int, pixel i of a segment sits i steps along the major axis and the minor axis
+    # follows Bresenham's rounding, floor( ( 2 * minor_delta * i + major_delta ) / ( 2 * major_delta ) ).
+    finite = np.isfinite( x0 ) & np.isfinite( y0 ) & np.isfinite( x1 ) & np.isfinite( y1 )
+    ix0, iy0, ix1, iy1 = ( np.clip( np.trunc( np.where( finite, c, 0 ) ), -LINE_COORD_LIMIT - 1, LINE_COORD_LIMIT ).astype( np.int64 ) for c in ( x0, y0, x1, y1 ) )
+    steps = line_steps( ix0, iy0, ix1, iy1, finite, width, height )
+    large = np.flatnonzero( ( np.abs( np.stack( ( ix0, iy0, ix1, iy1 ) ) ) > LINE_SAFE_LIMIT ).any( axis=0 ) )
+    if large.size:
+        # Every result fits int64 again once the segment is clipped to the image
+        exact = line_steps( *( c[ large ].astype( object ) for c in ( ix0, iy0, ix1, iy1 ) ), finite[ large ], width, height )
+        for step, value in zip( steps, exact ):
+            step[ large ] = value.astype( np.int64 )
+    count, remainder, minor_delta, divisor, flat_lo, major_flat, minor_flat = steps
+
+    ends = np.cumsum( count )
+    bounds = []
+    start = 0
+    while start < count.size:
+        stop = max( int( np.searchsorted( ends, ends[ start ] - count[ start ] + budget, side="right" ) ), start + 1 )
+        bounds.append( ( start, stop ) )
+        start = stop
+
+    def chunk_pixels( bound ):
+        start, stop = bound
+        chunk = slice( start, stop )
+        chunk_count = count[ chunk ]
+        # Pixel p of the chunk is step p - offset of its segment
+        offset = np.cumsum( chunk_count ) - chunk_count
+        p = np.arange( int( chunk_count.sum( ) ) )
+        ticks = ( np.repeat( remainder[ chunk ] - 2 * minor_delta[ chunk ] * offset, chunk_count ) + np.repeat( 2 * minor_delta[ chunk ], chunk_count ) * p ) // np.repeat( 2 * divisor[ chunk ], chunk_count )
+        flat = np.repeat( flat_lo[ chunk ] - major_flat[ chunk ] * offset, chunk_count ) + np.repeat( major_flat[ chunk ], chunk_count ) * p + np.repeat( minor_flat[ chunk ], chunk_count ) * ticks
+        return np.repeat( np.arange( start, stop, dtype=np.int32 ), chunk_count ), flat
+
+    yield from parallel_map( chunk_pixels, bounds, workers )
+
+def paint_last( canvas, writes, colors, workers=1 ):
+    # writes yields ( index, y * width + x ) arrays in drawing order. Each pixel takes the colour of
+    # the highest index written to it; maximum.at finds that deterministically, unlike a
+    # repeated-index assignment, whose winner NumPy leaves undefined. It stays on one thread,
+    # the fill from the owner buffer below runs in bands.
+    # For a ( frames, height, width, 3 ) canvas, writes holds one such iterable per frame. Each
+    # frame starts as a copy of the one before and only repaints the pixels its own writes touch.
+    frames = canvas if canvas.ndim == 4 else canvas[ None ]
+    owner = np.full( frames.shape[ 1 ] * frames.shape[ 2 ], -1, dtype=np.int32 )
+    for f, frame_writes in enumerate( writes if canvas.ndim == 4 else [ writes ] ):
+        pixels = frames[ f ].reshape( -1, 3 )
+        if f == 0:
+            for index, flat in frame_writes:
+                np.maximum.at( owner, flat, index )
+
+            def fill( bound ):
+                band_owner = owner[ bound[ 0 ]:bound[ 1 ] ]
+                drawn = band_owner >= 0
+                pixels[ bound[ 0 ]:bound[ 1 ] ][ drawn ] = colors[ band_owner[ drawn ] ]
+
+            with NODE_STATS.phase( "convert" ):
+                run_parallel( fill, split_range( owner.size, -( -owner.size // BAND_PIXELS ) ), workers )
+        else:
+            with NODE_STATS.phase( "convert" ):
+                frames[ f ] = frames[ f - 1 ]
+            touched = []
+            for index, flat in frame_writes:
+                np.maximum.at( owner, flat, index )
+                touched.append( flat )
+            if touched:
+                touched = np.unique( np.concatenate( touched ) )
+                with NODE_STATS.phase( "convert" ):
+                    pixels[ touched ] = colors[ owner[ touched ] ]
+
+def frame_ends( total, frames ):
+    # How much of total each of frames evenly spaced snapshots shows; the last one shows it all
+    return [ -( -( f + 1 ) * total // frames ) for f in range( frames ) ]
+
+def offset_chunks( chunks, offset ):
+    for index, flat in chunks:
+        yield index + offset, flat
+
+def draw_segments( canvas, x0, y0, x1, y1, colors, workers=1, ends=None ):
+    # With ends, canvas is a stack of frames and frame f shows the segments before ends[ f ]
+    height, width = canvas.shape[ -3:-1 ]
+    if ends is None:
+        writes = line_pixel_chunks( x0, y0, x1, y1, width, height, workers=workers )
+    else:
+        writes = [ offset_chunks( line_pixel_chunks( x0[ a:b ], y0[ a:b ], x1[ a:b ], y1[ a:b ], width, height, workers=workers ), a ) for a, b in zip( [ 0 ] + ends[ :-1 ], ends ) ]
+    paint_last( canvas, writes, colors, workers )
+
+# ( dx, dy ) of meander directions 0-7, clockwise from up; the last row is for directions that stay put
+MEANDER_STEPS = np.array( [ ( 0, -1 ), ( 1, -1 ), ( 1, 0 ), ( 1, 1 ), ( 0, 1 ), ( -1, 1 ), ( -1, 0 ), ( -1, -1 ), ( 0, 0 ) ], dtype=np.float64 )
+
+def bounce_walk( steps, start, size ):
+    # Position after every step before and after a step off the image is pulled back to the edge
+    raw = []
+    kept = []
+    position = start
+    for step in steps.tolist( ):
+        position = position + step
+        raw.append( position )
+        if not 0 <= position < size:
+            position = clamp( position, 0, size - 1 )
+        kept.append( position )
+    return np.array( raw, dtype=np.float64 ), np.array( kept, dtype=np.float64 )
+
+def meander_pixels( values, lv, mv, length_scale, start_x, start_y, width, height, boundary_behavior ):
+    # Index and y * width + x of every value that lands on the image
+    values = np.asarray( values, dtype=np.float64 )
+    direction = np.broadcast_to( remap( values, lv, mv, 0, 7 ), values.shape )
+    with np.errstate( invalid='ignore' ):
+        direction = np.where( ( direction > -1 ) & ( direction < 8 ), np.trunc( direction ), 8 ).astype( np.intp )
+    step_x = MEANDER_STEPS[ direction, 0 ] * length_scale
+    step_y = MEANDER_STEPS[ direction, 1 ] * length_scale
+
+    if boundary_behavior == "bounce":
+        raw_x, kept_x = bounce_walk( step_x, start_x, width )
+        raw_y, kept_y = bounce_walk( step_y, start_y, height )
+        # Leaving through the top or bottom draws at the pulled-back point, leaving sideways does not
+        y_out = ~( ( raw_y >= 0 ) & ( raw_y < height ) )
+        draw_x = np.where( y_out, kept_x, raw_x )
+        draw_y = np.where( y_out, kept_y, raw_y )
+    else:
+        draw_x = np.cumsum( np.concatenate( ( [ start_x ], step_x ) ) )[ 1: ]
+        draw_y = np.cumsum( np.concatenate( ( [ start_y ], step_y ) ) )[ 1: ]
+        if boundary_behavior == "clamp":
+            draw_x = clamp_array( draw_x, 0, width - 1 )
+            draw_y = clamp_array( draw_y, 0, height - 1 )
+        elif boundary_behavior == "wrap":
+            draw_x = draw_x % width
+            draw_y = draw_y % height
+
+    inside = ( draw_x >= 0 ) & ( draw_x < width ) & ( draw_y >= 0 ) & ( draw_y < height )
+    flat = np.trunc( draw_y[ inside ] ).astype( np.int64 ) * width + np.trunc( draw_x[ inside ] ).astype( np.int64 )
+    return np.flatnonzero( inside ).astype( np.int32 ), flat
+
+def draw_wide_segments( canvas, x0, y0, x1, y1, colors, line_width, workers=1, ends=None ):
+    # Wide lines keep PIL's polygon rasterizer. A polyline draws exactly like separate calls per
+    # segment, so consecutive segments that join up and share a colour go in one call. With ends,
+    # canvas is a stack of frames; the same image keeps being drawn on and is copied out as frame f
+    # once the segments before ends[ f ] are in.
+    if not x0.size:
+        return
+    frames = canvas if ends is not None else canvas[ None ]
+    ends = ends if ends is not None else [ x0.size ]
+    height, width = frames.shape[ 1:3 ]
+    outimage = Image.new( "RGB", ( width, height ) )
+    draw = ImageDraw.Draw( outimage )
+    breaks = ( x0[ 1: ] != x1[ :-1 ] ) | ( y0[ 1: ] != y1[ :-1 ] ) | ( colors[ 1: ] != colors[ :-1 ] ).any( axis=1 )
+    cuts = np.array( ends[ :-1 ], dtype=np.intp )
+    breaks[ cuts[ ( cuts > 0 ) & ( cuts < x0.size ) ] - 1 ] = True
+    starts = [ 0 ] + ( np.flatnonzero( breaks ) + 1 ).tolist( )
+    runs = iter( zip( starts, starts[ 1: ] + [ x0.size ] ) )
+    run = next( runs, None )
+    for f, ( frame, end ) in enumerate( zip( frames, ends ) ):
+        if f and ends[ f - 1 ] == end:
+            with NODE_STATS.phase( "convert" ):
+                frame[ ... ] = frames[ f - 1 ]
+            continue
+        while run is not None and run[ 1 ] <= end:
+            start, stop = run
+            points = [ ( x0[ start ], y0[ start ] ) ] + list( zip( x1[ start:stop ].tolist( ), y1[ start:stop ].tolist( ) ) )
+            draw.line( points, fill=tuple( colors[ start ].tolist( ) ), width=line_width )
+            run = next( runs, None )
+
+        def convert( rows ):
+            frame[ rows[ 0 ]:rows[ 1 ] ] = unit_float( np.asarray( outimage.crop( ( 0, rows[ 0 ], width, rows[ 1 ] ) ) ) )
+
+        with NODE_STATS.phase( "convert" ):
+            run_parallel( convert, split_range( height, -( -height // band_rows( width ) ) ), workers )
+
+BATCH_SEPARATORS = { "newline": "\n", "semicolon": ";", "pipe": "|" }
+
+def split_batch( sequence, separator ):
+    if separator == "none":
+        return [ sequence ]
+    parts = [ part for part in sequence.split( BATCH_SEPARATORS[ separator ] ) if part.strip() ]
+    return parts or [ "" ]
+
+def parse_batch_list( text, cast, name, node="IntSeqImage" ):
+    try:
+        return [ cast( x.strip() ) for x in text.split( ',' ) if x.strip() ]
+    except ValueError:
+        raise ValueError( f"Warning: [{node}] Could not parse {name}. Please ensure it's a comma-separated list." )
+
+def wave_values( type, length, amplitude, frequency, phase_offset, vertical_offset, slope, duty_cycle ):
+    phase_rad = math.radians( phase_offset )
+    t = ( np.arange( length ) / length ) * ( 2 * math.pi * frequency ) + phase_rad
+    normalized_t = ( t / ( 2 * math.pi ) ) % 1
+
+    # Both sides of each np.where are evaluated, so the unused branch may divide by zero
+    with np.errstate( divide='ignore', invalid='ignore', over='ignore' ):
+        if type == "sine":
+            values = amplitude * np.sin( t ) + vertical_offset
+        elif type == "cosine":
+            values = amplitude * np.cos( t ) + vertical_offset
+        elif type == "tangent":
+            values = amplitude * np.arctan( np.tan( t ) ) * ( 2 / math.pi ) + vertical_offset
+        elif type == "cotangent":
+            tan_val = np.tan( t )
+            values = np.where( tan_val == 0, np.nan, amplitude * np.arctan( 1 / tan_val ) * ( 2 / math.pi ) + vertical_offset )
+        elif type == "sawtooth":
+            values = np.where( normalized_t < duty_cycle,
+                               amplitude * ( normalized_t / duty_cycle ) - amplitude / 2,
+                               amplitude * ( ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) ) - amplitude / 2 ) + vertical_offset
+        elif type == "triangle":
+            values = np.where( normalized_t < duty_cycle,
+                               amplitude * ( 2 * normalized_t / duty_cycle - 1 ),
+                               amplitude * ( 1 - 2 * ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) ) ) + vertical_offset
+        elif type == "sigmoid":
+            sigmoid_input = remap( t, 0, 2 * math.pi * frequency, -6 * frequency, 6 * frequency ) * slope
+            values = amplitude * ( 1 / ( 1 + np.exp( -sigmoid_input ) ) ) + vertical_offset - amplitude / 2
+        elif type == "square":
+            values = np.where( normalized_t < duty_cycle, amplitude + vertical_offset, -amplitude + vertical_offset )
+        else:
+            values = np.zeros( length )
+
+    return values
+
+class NodeStats:
+    # Opt-in timing of node calls. Every wrapped call adds a record with the time spent in each
+    # phase, its input size and output bytes to a ring buffer, which can be dumped as JSON and
+    # summarised in the log every few seconds. Nodes mark their parse and convert phases and the
+    # result cache marks its own; the rest of the call counts as compute. Image nodes render straight
+    # into the output tensor, so their convert phase is the time spent writing float pixels into it.
+    # Nested phases pause the enclosing one, so phase times add up to the call's time.
+    def __init__( self, enabled, size=1000, log_seconds=0, path=None ):
+        self.enabled = enabled
+        self.records = collections.deque( maxlen=size )
+        self.log_seconds = log_seconds
+        self.path = path
+        self.last_log = time.monotonic( )
+        self.lock = threading.Lock( )
+        self.local = threading.local( )
+
+    def phase( self, name ):
+        if not self.enabled or getattr( self.local, "record", None ) is None:
+            return contextlib.nullcontext( )
+        return self.timed( name )
+
+    @contextlib.contextmanager
+    def timed( self, name ):
+        local = self.local
+        phases = local.record[ "phases" ]
+        now = time.perf_counter( )
+        if local.stack:
+            phases[ local.stack[ -1 ] ] = phases.get( local.stack[ -1 ], 0.0 ) + now - local.mark
+        local.stack.append( name )
+        local.mark = now
+        try:
+            yield
+        finally:
+            now = time.perf_counter( )
+            phases[ name ] = phases.get( name, 0.0 ) + now - local.mark
+            local.stack.pop( )
+            local.mark = now
+
+    def note( self, key, value ):
+        record = getattr( self.local, "record", None )
+        if record is not None:
+            record[ key ] = value
+
+    @staticmethod
+    def input_size( values ):
+        chars = sum( len( value ) for value in values if isinstance( value, str ) )
+        items = sum( value.size if isinstance( value, np.ndarray ) else value.nelement( ) for value in values if isinstance( value, np.ndarray ) or torch.is_tensor( value ) )
+        return chars, items
+
+    def wrap( self, node, fn ):
+        @functools.wraps( fn )
+        def wrapper( *args, **kwargs ):
+            if getattr( self.local, "record", None ) is not None:
+                return fn( *args, **kwargs )
+            chars, items = self.input_size( list( args ) + list( kwargs.values( ) ) )
+            record = dict( node=node, function=fn.__name__, time=time.time( ), input_chars=chars, input_values=items, phases={} )
+            self.local.record = record
+            self.local.stack = []
+            start = time.perf_counter( )
+            try:
+                result = fn( *args, **kwargs )
+                record[ "output_bytes" ] = ResultCache.nbytes( result )
+                return result
+            except Exception as error:
+                record[ "error" ] = type( error ).__name__
+                raise
+            finally:
+                record[ "seconds" ] = time.perf_counter( ) - start
+                record[ "phases" ][ "compute" ] = max( 0.0, record[ "seconds" ] - sum( record[ "phases" ].values( ) ) )
+                self.local.record = None
+                self.add( record )
+        return wrapper
+
+    def add( self, record ):
+        with self.lock:
+            self.records.append( record )
+            due = self.log_seconds and time.monotonic( ) - self.last_log >= self.log_seconds
+            if due:
+                self.last_log = time.monotonic( )
+        if due:
+            self.log( )
+
+    def summary( self ):
+        with self.lock:
+            records = list( self.records )
+        nodes = {}
+        for record in records:
+            nodes.setdefault( f"{record[ 'node' ]}.{record[ 'function' ]}", [] ).append( record )
+        summary = {}
+        for name, calls in nodes.items( ):
+            seconds = sorted( call[ "seconds" ] for call in calls )
+            phases = {}
+            for call in calls:
+                for phase, value in call[ "phases" ].items( ):
+                    phases[ phase ] = phases.get( phase, 0.0 ) + value / len( calls )
+            summary[ name ] = dict( calls=len( calls ), mean=sum( seconds ) / len( calls ), p95=seconds[ min( len( seconds ) - 1, int( 0.95 * len( seconds ) ) ) ], phases=phases, output_bytes=sum( call.get( "output_bytes", 0 ) for call in calls ) / len( calls ) )
+        return summary
+
+    def dump( self, path=None ):
+        with self.lock:
+            records = list( self.records )
+        text = json.dumps( dict( summary=self.summary( ), records=records ), indent=2 )
+        if path:
+            with open( path, "w" ) as file:
+                file.write( text )
+        return text
+
+    def log( self ):
+        for name, stats in self.summary( ).items( ):
+            phases = "".join( f", {phase} {value:.3f}s" for phase, value in stats[ "phases" ].items( ) if value >= 0.0005 )
+            print( f"[IntSeq] {name}: {stats[ 'calls' ]} calls, mean {stats[ 'mean' ]:.3f}s{phases}, p95 {stats[ 'p95' ]:.3f}s, {stats[ 'output_bytes' ] / ( 1 << 20 ):.1f} MB out" )
+        if self.path:
+            try:
+                self.dump( self.path )
+            except OSError as error:
+                print( f"Warning: [IntSeq] Could not write node stats to {self.path}: {error}" )
+
+# INTSEQ_STATS=1 turns on per-call timing. INTSEQ_STATS_SIZE calls are kept, a summary is logged
+# every INTSEQ_STATS_LOG seconds ( 0 for never ) and, with INTSEQ_STATS_FILE, dumped there as JSON
+NODE_STATS = NodeStats( os.environ.get( "INTSEQ_STATS", "" ).lower( ) not in ( "", "0", "false", "no" ), int( os.environ.get( "INTSEQ_STATS_SIZE", 1000 ) ), float( os.environ.get( "INTSEQ_STATS_LOG", 60 ) ), os.environ.get( "INTSEQ_STATS_FILE" ) or None )
+
+class ResultCache:
+    # Node results keyed by a hash of every input. The memory tier is an LRU bounded by bytes. With a
+    # directory set, results are also written as .npy and .txt files and loaded back memory-mapped,
+    # so they survive restarts and a hit reads only the pages that are used.
+    # Callers never share anything they can write to: arrays are read-only, the memory tier keeps
+    # its own copy of each tensor and hands out clones, and every disk hit maps the file afresh.
+    VERSION = 1
+
+    def __init__( self, memory_bytes, directory=None, disk_bytes=0 ):
+        self.memory_bytes = memory_bytes
+        self.directory = directory
+        self.disk_bytes = disk_bytes
+        self.entries = collections.OrderedDict( )
+        self.size = 0
+        self.lock = threading.Lock( )
+        self.counters = dict.fromkeys( ( "hits", "disk_hits", "misses", "evictions", "disk_writes", "disk_evictions" ), 0 )
+
+    @staticmethod
+    def key( name, arguments ):
+        digest = hashlib.blake2b( f"{ResultCache.VERSION}:{name}".encode( ), digest_size=20 )
+        for argument, value in arguments.items( ):
+            digest.update( f"|{argument}=".encode( ) )
+            if isinstance( value, np.ndarray ):
+                digest.update( f"{value.dtype.str}{value.shape}".encode( ) )
+                digest.update( np.ascontiguousarray( value ).data )
+            else:
+                digest.update( f"{type( value ).__name__}:{value!r}".encode( ) )
+        return digest.hexdigest( )
+
+    @staticmethod
+    def nbytes( result ):
+        return sum( item.element_size( ) * item.nelement( ) if torch.is_tensor( item ) else item.nbytes if isinstance( item, np.ndarray ) else len( str( item ) ) for item in result )
+
+    def get_or_compute( self, name, arguments, compute ):
+        with NODE_STATS.phase( "cache" ):
+            key = self.key( name, arguments )
+        with self.lock:
+            result = self.entries.get( key )
+            if result is not None:
+                self.entries.move_to_end( key )
+                self.counters[ "hits" ] += 1
+        if result is not None:
+            NODE_STATS.note( "cache", "memory" )
+            return tuple( item.clone( ) if torch.is_tensor( item ) else item for item in result[ 0 ] )
+        with NODE_STATS.phase( "cache" ):
+            result = self.load( key ) if self.directory else None
+        if result is not None:
+            # Mapping the file again is as cheap as a memory hit, so disk hits stay out of memory
+            NODE_STATS.note( "cache", "disk" )
+            with self.lock:
+                self.counters[ "disk_hits" ] += 1
+            return result
+        with self.lock:
+            self.counters[ "misses" ] += 1
+        result = compute( )
+        # Cached arrays are shared between callers, so later in-place edits must not reach them
+        for item in result:
+            if isinstance( item, np.ndarray ):
+                item.setflags( write=False )
+        if self.directory:
+            with NODE_STATS.phase( "cache" ):
+                self.store( key, result )
+        self.remember( key, result )
+        return result
+
+    def remember( self, key, result ):
+        size = self.nbytes( result )
+        if size > self.memory_bytes:
+            return
+        # The caller keeps the computed tensors, so the cache holds copies of its own
+        result = tuple( item.clone( ) if torch.is_tensor( item ) else item for item in result )
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[ key ] = ( result, size )
+            self.size += size
+            while self.size > self.memory_bytes:
+                _, ( _, evicted ) = self.entries.popitem( last=False )
+                self.size -= evicted
+                self.counters[ "evictions" ] += 1
+
+    def path( self, key, suffix ):
+        return os.path.join( self.directory, key[ :2 ], key + suffix )
+
+    def load( self, key ):
+        try:
+            with open( self.path( key, ".json" ) ) as manifest:
+                kinds = json.load( manifest )
+            result = []
+            for index, kind in enumerate( kinds ):
+                if kind == "str":
+                    with open( self.path( key, f".{index}.txt" ), encoding="utf-8" ) as text:
+                        result.append( text.read( ) )
+                elif kind == "tensor":
+                    # A private copy-on-write mapping: nothing is read until used, and writes reach
+                    # neither the file nor any other hit
+                    result.append( torch.from_numpy( np.load( self.path( key, f".{index}.npy" ), mmap_mode="c" ) ) )
+                else:
+                    result.append( np.load( self.path( key, f".{index}.npy" ), mmap_mode="r" ) )
+            os.utime( self.path( key, ".json" ) )
+            return tuple( result )
+        except ( OSError, ValueError ):
+            return None
+
+    def store( self, key, result ):
+        if self.disk_bytes and self.nbytes( result ) > self.disk_bytes:
+            return
+        try:
+            os.makedirs( os.path.dirname( self.path( key, "" ) ), exist_ok=True )
+            kinds = []
+            for index, item in enumerate( result ):
+                if isinstance( item, str ):
+                    kinds.append( "str" )
+                    self.write( self.path( key, f".{index}.txt" ), lambda file: file.write( item.encode( "utf-8" ) ) )
+                else:
+                    kinds.append( "tensor" if torch.is_tensor( item ) else "array" )
+                    array = item.cpu( ).numpy( ) if torch.is_tensor( item ) else item
+                    self.write( self.path( key, f".{index}.npy" ), lambda file: np.save( file, array ) )
+            # The manifest goes last, so a half-written entry is never loaded
+            self.write( self.path( key, ".json" ), lambda file: file.write( json.dumps( kinds ).encode( ) ) )
+            with self.lock:
+                self.counters[ "disk_writes" ] += 1
+            if self.disk_bytes:
+                self.trim_disk( )
+        except OSError as error:
+            print( f"Warning: [IntSeq] Could not write to the result cache in {self.directory}: {error}" )
+
+    @staticmethod
+    def write( path, fill ):
+        partial = f"{path}.{os.getpid( )}.{threading.get_ident( )}.tmp"
+        with open( partial, "wb" ) as file:
+            fill( file )
+        os.replace( partial, path )
+
+    def trim_disk( self ):
+        # Least recently used entries go first; a load touches the manifest
+        entries = {}
+        for folder, _, files in os.walk( self.directory ):
+            for file in files:
+                key = file.split( "." )[ 0 ]
+                stat = os.stat( os.path.join( folder, file ) )
+                used, size, paths = entries.get( key, ( 0, 0, [] ) )
+                used = stat.st_mtime if file.endswith( ".json" ) else used
+                entries[ key ] = ( used, size + stat.st_size, paths + [ os.path.join( folder, file ) ] )
+        total = sum( size for _, size, _ in entries.values( ) )
+        for key, ( _, size, paths ) in sorted( entries.items( ), key=lambda entry: entry[ 1 ][ 0 ] ):
+            if total <= self.disk_bytes:
+                break
+            for path in sorted( paths, key=lambda path: not path.endswith( ".json" ) ):
+                os.remove( path )
+            total -= size
+            with self.lock:
+                self.counters[ "disk_evictions" ] += 1
+
+    def stats( self ):
+        with self.lock:
+            return dict( self.counters, entries=len( self.entries ), bytes=self.size, limit=self.memory_bytes, directory=self.directory )
+
+    def clear( self ):
+        with self.lock:
+            self.entries.clear( )
+            self.size = 0
+
+# Both tiers are opt-in. INTSEQ_CACHE_MB sizes the memory tier; INTSEQ_CACHE_DIR adds the disk
+# tier, trimmed to INTSEQ_CACHE_DISK_MB when that is set
+RESULT_CACHE = ResultCache( int( float( os.environ.get( "INTSEQ_CACHE_MB", 0 ) ) * ( 1 << 20 ) ), os.environ.get( "INTSEQ_CACHE_DIR" ) or None, int( float( os.environ.get( "INTSEQ_CACHE_DISK_MB", 0 ) ) * ( 1 << 20 ) ) )
+
+def cached_result( ignore=( ) ):
+    # Node methods wrapped with this return the cached result for inputs they have seen before.
+    # Inputs named in ignore do not change the result, so they are left out of the key.
+    def decorate( fn ):
+        signature = inspect.signature( fn )
+
+        @functools.wraps( fn )
+        def wrapper( self, *args, **kwargs ):
+            if not RESULT_CACHE.memory_bytes and not RESULT_CACHE.directory:
+                return fn( self, *args, **kwargs )
+            bound = signature.bind( self, *args, **kwargs )
+            bound.apply_defaults( )
+            arguments = { name: value for name, value in list( bound.arguments.items( ) )[ 1: ] if name not in ignore }
+            return RESULT_CACHE.get_or_compute( fn.__qualname__, arguments, lambda: fn( self, *args, **kwargs ) )
+        return wrapper
+    return decorate
+
 class IntSeqImage:
     @classmethod
     def INPUT_TYPES( cls ):
@@ -43,6 +870,16 @@ class IntSeqImage:
                 "start_x": ( "INT", { "default": 0, "min": 0, "max": 1024, "step": 1, "tooltip": "Starting X" } ),
                 "start_y": ( "INT", { "default": 0, "min": 0, "max": 1024, "step": 1, "tooltip": "Starting Y" } ),
                 "boundary_behavior": ( [ "clamp", "wrap", "bounce", "none" ], { "default": "clamp", "tooltip": "[Angle/Length, Run/Turn, Meander] How to handle the drawing point at image boundaries" } )
+            },
+            "optional": {
+                "batch_separator": ( [ "none", "newline", "semicolon", "pipe" ], { "default": "none", "tooltip": "[Batch] Split sequence into several sequences, rendered as one image batch" } ),
+                "rules": ( "STRING", { "default": "", "tooltip": "[Batch] Comma-separated rules, one per batch image (overrides rule)" } ),
+                "color_offsets": ( "STRING", { "default": "", "tooltip": "[Batch] Comma-separated color offsets, one per batch image (overrides color_offset)" } ),
+                "intseq": ( "INTSEQ", { "tooltip": "Sequence array from another IntSeq node (overrides sequence)" } ),
+                "workers": ( "INT", { "default": 1, "min": 0, "max": 256, "step": 1, "tooltip": "Threads that render row bands in parallel; 0 uses every core. Output is identical for any count" } ),
+                "frames": ( "INT", { "default": 1, "min": 1, "max": 4096, "step": 1, "tooltip": "[Animation] Render this many snapshots of each image as it progresses, one batch image each" } ),
+                "animation": ( [ "reveal", "scroll" ], { "default": "reveal", "tooltip": "[Animation] reveal: frames show the drawing up to evenly spaced points. scroll: [Cellular Automaton] frames move a window down the evolution" } ),
+                "frame_step": ( "INT", { "default": 1, "min": 1, "max": 8192, "step": 1, "tooltip": "[Animation, scroll] Generations the window moves per frame" } ),
             }
         }
 
@@ -50,9 +887,8 @@ class IntSeqImage:
     FUNCTION = "generate_image"
     CATEGORY = "IntSeq/image"
 
-    def generate_image( self, width, height, sequence, method, rule, color_offset, value_min, value_max, red_min, red_max, green_min, green_max, blue_min, blue_max, angle_scale, length_scale, line_width, start_x, start_y, boundary_behavior ):
-        img_mode = "RGB" if method in [ "RGB", "angle and length", "run and turn", "meander", "cellular automaton" ] else "L"
-        
+    @cached_result( ignore=( "workers", ) )
+    def generate_image( self, width, height, sequence, method, rule, color_offset, value_min, value_max, red_min, red_max, green_min, green_max, blue_min, blue_max, angle_scale, length_scale, line_width, start_x, start_y, boundary_behavior, batch_separator="none", rules="", color_offsets="", intseq=None, workers=1, frames=1, animation="reveal", frame_step=1 ):
         lv = 0 if value_min == -1 else value_min
         mv = 255 if value_max == -1 else value_max
         lr = lv if red_min == -1 else red_min
@@ -62,190 +898,370 @@ class IntSeqImage:
         lb = lv if blue_min == -1 else blue_min
         mb = mv if blue_max == -1 else blue_max
 
-        try:
-            values = [ float( x.strip() ) for x in sequence.split( ',' ) if x.strip() ]
-        except ValueError:
-            raise ValueError( "Warning: [IntSeqNoise] Could not parse all values. Please ensure it's a comma-separated list of numbers." )
+        with NODE_STATS.phase( "parse" ):
+            try:
+                if intseq is not None:
+                    # RGB never shows more than one value per pixel
+                    batch_values = [ sequence_values( sequence, intseq, width * height if method == "RGB" else None ) ]
+                else:
+                    batch_values = [ parse_values( seq ) for seq in split_batch( sequence, batch_separator ) ]
+            except ValueError:
+                raise ValueError( "Warning: [IntSeqNoise] Could not parse all values. Please ensure it's a comma-separated list of numbers." )
 
-        if not values:
-            return ( torch.zeros( ( 1, height, width, 3 ), dtype=torch.float32 ), )
-        
-        outimage = Image.new( img_mode, ( width, height ), (0,0,0) )
-        draw = ImageDraw.Draw( outimage )
+            rule_list = parse_batch_list( rules, int, "rules" ) or [ rule ]
+            offset_list = parse_batch_list( color_offsets, float, "color_offsets" ) or [ color_offset ]
+        if not all( 0 <= r <= 255 for r in rule_list ):
+            raise ValueError( "Warning: [IntSeqImage] Rules must be between 0 and 255." )
+
+        # Shorter lists cycle to the batch size, the same way a short sequence tiles across the image
+        batch_size = max( len( batch_values ), len( rule_list ), len( offset_list ) )
+        batch_values = [ batch_values[ b % len( batch_values ) ] for b in range( batch_size ) ]
+        rule_list = [ rule_list[ b % len( rule_list ) ] for b in range( batch_size ) ]
+        offset_list = [ offset_list[ b % len( offset_list ) ] for b in range( batch_size ) ]
+        filled = [ b for b in range( batch_size ) if len( batch_values[ b ] ) ]
+
+        if not filled:
+            return ( torch.zeros( ( batch_size * frames, height, width, 3 ), dtype=torch.float32 ), )
+
+        # Rendering writes straight into the output tensor, one band of rows at a time. Path methods
+        # only touch the pixels they draw, empty sequences stay black and revealed frames are only
+        # partly drawn, so those start zeroed. Each batch image owns frames consecutive outputs.
+        scroll = animation == "scroll" and method == "cellular automaton"
+        blank = method not in ( "RGB", "cellular automaton" ) or len( filled ) < batch_size or ( frames > 1 and not scroll )
+        with NODE_STATS.phase( "convert" ):
+            result = ( torch.zeros if blank else torch.empty )( ( batch_size * frames, height, width, 3 ), dtype=torch.float32 )
+            out = result.numpy( )
+        band = band_rows( width )
+        workers = resolve_workers( workers )
 
         if method == "RGB":
-            value_index = 0
-            for y in range( height ):
-                for x in range( width ):
-                    nv = values[ value_index % len( values ) ]
-                    nv = clamp( nv, lv, mv )
-                    nr = int( remap( nv, lv, mv, lr, mr ) )
-                    ng = int( remap( ( nv + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ) )
-                    nb = int( remap( ( nv + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ) )
-                    outimage.putpixel( ( x, y ), ( nr, ng, nb ) )
-                    value_index += 1
+            # Only the first width * height values are ever visible; shorter sequences tile
+            tables = [ batch_values[ b ][ :width * height ] for b in filled ]
+            table_len = max( len( t ) for t in tables )
+            padded = np.stack( [ np.resize( t, table_len ) for t in tables ] )
+            offsets = np.array( [ offset_list[ b ] for b in filled ], dtype=np.float64 )[ :, None ]
+            colors = unit_float( map_colors( padded, offsets, lv, mv, lr, mr, lg, mg, lb, mb ) )
+            # One band per worker, each at least a table long so the doubling copies stay large.
+            # Frame f shows the pixels before ends[ f ].
+            ends = frame_ends( width * height, frames )
+            jobs = [ ( i, b * frames + f, bound ) for i, b in enumerate( filled ) for f in range( frames ) for bound in split_range( ends[ f ], workers, len( tables[ i ] ) ) ]
+
+            def tile_band( job ):
+                i, frame, ( start, stop ) = job
+                tile_pixels( out[ frame ].reshape( -1, 3 ), colors[ i, :len( tables[ i ] ) ], start, stop )
+
+            with NODE_STATS.phase( "convert" ):
+                run_parallel( tile_band, jobs, workers )
 
         elif method == "cellular automaton":
-            rule_bits = format( rule, '08b' )
-            
-            current_row = [ 0 ] * width
-            for i in range( width ):
-                val = values[ i % len( values ) ]
-                current_row[ i ] = int( remap( val, min( values ), max( values ), 0, 1.99 ) ) % 2
-
-            color0 = ( lr, lg, lb )
-            color1 = ( mr, mg, mb )
-
-            for y in range( height ):
-                next_row = [ 0 ] * width
-                for x in range( width ):
-                    state = current_row[ x ]
-                    color = color1 if state == 1 else color0
-                    outimage.putpixel( ( x, y ), color )
-                    
-                    if y < height - 1:
-                        left = current_row[ ( x - 1 + width ) % width ]
-                        center = current_row[ x ]
-                        right = current_row[ ( x + 1 ) % width ]
-                        
-                        pattern_index = 7 - ( left * 4 + center * 2 + right )
-                        new_state = int( rule_bits[ pattern_index ] )
-                        next_row[ x ] = new_state
-                
-                current_row = next_row
+            seeds = np.stack( [ automaton_seed( batch_values[ b ], width ) for b in filled ] )
+            palette = unit_float( np.array( [ ( lr, lg, lb ), ( mr, mg, mb ) ], dtype=np.uint8 ) )
+            # The evolution is run once. Frame f shows generations shift to shift + height when
+            # scrolling, or generations 0 to ends[ f ] when revealing; each block of generations is
+            # copied into every frame it appears in.
+            ends = frame_ends( height, frames )
+            total = height + ( frames - 1 ) * frame_step if scroll else height
+            # Generations depend on the row above, so only the conversion of each block runs in parallel
+            for y0, generations in run_automaton( seeds, [ rule_list[ b ] for b in filled ], total, band ):
+                y1 = y0 + generations.shape[ 1 ]
+                jobs = []
+                for f in range( frames ):
+                    shift = f * frame_step if scroll else 0
+                    low, high = max( y0, shift ), min( y1, shift + height if scroll else ends[ f ] )
+                    jobs += [ ( i, b * frames + f, low + rows[ 0 ], low + rows[ 1 ], shift ) for i, b in enumerate( filled ) for rows in split_range( high - low, workers ) ]
+
+                def paint_rows( job ):
+                    i, frame, start, stop, shift = job
+                    np.take( palette, generations[ i, start - y0:stop - y0 ], axis=0, out=out[ frame, start - shift:stop - shift ] )
+
+                with NODE_STATS.phase( "convert" ):
+                    run_parallel( paint_rows, jobs, workers )
 
         elif method == "meander":
-            current_x = start_x
-            current_y = start_y
-
-            for i in values:
-                color_val = clamp( i, lv, mv )
-                nr = int( remap( color_val, lv, mv, lr, mr ) )
-                ng = int( remap( ( color_val + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ) )
-                nb = int( remap( ( color_val + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ) )
-                pixel_color = ( nr, ng, nb )
-
-                direction = int( remap( i, lv, mv, 0, 7 ) )
-                if direction == 0:    # Up
-                    current_y -= 1 * length_scale
-                elif direction == 1:  # Up-Right
-                    current_y -= 1 * length_scale
-                    current_x += 1 * length_scale
-                elif direction == 2:  # Right
-                    current_x += 1 * length_scale
-                elif direction == 3:  # Down-Right
-                    current_y += 1 * length_scale
-                    current_x += 1 * length_scale
-                elif direction == 4:  # Down
-                    current_y += 1 * length_scale
-                elif direction == 5:  # Down-Left
-                    current_y += 1 * length_scale
-                    current_x -= 1 * length_scale
-                elif direction == 6:  # Left
-                    current_x -= 1 * length_scale
-                elif direction == 7:  # Up-Left
-                    current_y -= 1 * length_scale
-                    current_x -= 1 * length_scale
-
-                draw_x, draw_y = current_x, current_y
-                if boundary_behavior == "clamp":
-                    draw_x = clamp( current_x, 0, width - 1 )
-                    draw_y = clamp( current_y, 0, height - 1 )
-                elif boundary_behavior == "wrap":
-                    draw_x = current_x % width
-                    draw_y = current_y % height
-                elif boundary_behavior == "bounce":
-                    if not 0 <= current_x < width:
-                        current_x = clamp( current_x, 0, width - 1 )
-                    if not 0 <= current_y < height:
-                        current_y = clamp( current_y, 0, height - 1 )
-                        draw_x, draw_y = current_x, current_y
-        
-                if 0 <= draw_x < width and 0 <= draw_y < height:
-                    outimage.putpixel( ( int( draw_x ), int( draw_y ) ), pixel_color )
-        
-        elif method == "angle and length":
-            current_x = start_x
-            current_y = start_y
-            current_angle = 0.0
-
-            for i in range( 0, len( values ) - 1, 2 ):
-                segment_length = values[ i ] * length_scale
-                turn_angle = values[ i + 1 ] * angle_scale
-                current_angle += turn_angle
-                nv = clamp( values[ i + 1 ], lv, mv )
-                nr = int( remap( nv, lv, mv, lr, mr ) )
-                ng = int( remap( ( nv + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ) )
-                nb = int (remap( ( nv + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ) )
-                line_color = ( nr, ng, nb )
-                rad_angle = math.radians( current_angle )
-                end_x = start_x + segment_length * math.cos( rad_angle )
-                end_y = start_y + segment_length * math.sin( rad_angle )
-                draw.line( [ ( start_x, start_y ), ( end_x, end_y ) ], fill=line_color, width=line_width )
-                
-                if boundary_behavior == "clamp":
-                    start_x = clamp( end_x, 0, width - 1 )
-                    start_y = clamp( end_y, 0, height - 1 )
-                elif boundary_behavior == "wrap":
-                    start_x = end_x % width
-                    start_y = end_y % height
-                elif boundary_behavior == "bounce":
-                    bounced = False
-                    if end_x < 0 or end_x >= width:
-                        current_angle = 180 - current_angle
-                        bounced = True
-                    if end_y < 0 or end_y >= height:
-                        current_angle = 360 - current_angle
-                        bounced = True
-                    if bounced:
-                        start_x = clamp( end_x, 0, width - 1 )
-                        start_y = clamp( end_y, 0, height - 1 )
-                    else:
-                        start_x, start_y = end_x, end_y
-                else:
-                    start_x, start_y = end_x, end_y
-
-        elif method == "run and turn":
-            current_x = start_x
-            current_y = start_y
-
-            for i in range( 0, len( values ) - 1, 2 ):
-                segment_length = values[ i ] * length_scale
-                turn_angle = values[ int( i + 1 ) ] * angle_scale
-                turn_angle = remap( turn_angle, lv, mv, 0, 360 )
-                nv = clamp( values[ i ], lv, mv )
-                nr = int( remap( nv, lv, mv, lr, mr ) )
-                ng = int( remap( ( nv + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ) )
-                nb = int (remap( ( nv + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ) )
-                line_color = ( nr, ng, nb )
-                rad_angle = math.radians( turn_angle )
-                end_x = start_x + segment_length * math.cos( rad_angle )
-                end_y = start_y + segment_length * math.sin( rad_angle )
-                draw.line( [ ( start_x, start_y ), ( end_x, end_y ) ], fill=line_color, width=line_width )
-                
-                if boundary_behavior == "clamp":
-                    start_x = clamp( end_x, 0, width - 1 )
-                    start_y = clamp( end_y, 0, height - 1 )
-                elif boundary_behavior == "wrap":
-                    start_x = end_x % width
-                    start_y = end_y % height
-                elif boundary_behavior == "bounce":
-                    bounced = False
-                    if end_x < 0 or end_x >= width:
-                        turn_angle = 180 - turn_angle
-                        bounced = True
-                    if end_y < 0 or end_y >= height:
-                        turn_angle = 360 - turn_angle
-                        bounced = True
-                    if bounced:
-                        start_x = clamp( end_x, 0, width - 1 )
-                        start_y = clamp( end_y, 0, height - 1 )
-                    else:
-                        start_x, start_y = end_x, end_y
+            for b in filled:
+                steps, flat = meander_pixels( batch_values[ b ], lv, mv, length_scale, start_x, start_y, width, height, boundary_behavior )
+                colors = map_colors( batch_values[ b ], offset_list[ b ], lv, mv, lr, mr, lg, mg, lb, mb )
+                # Steps are in drawing order, so each frame's writes are a slice of them
+                cuts = [ 0 ] + np.searchsorted( steps, frame_ends( len( batch_values[ b ] ), frames ) ).tolist( )
+                writes = [ [ ( steps[ a:c ], flat[ a:c ] ) ] for a, c in zip( cuts, cuts[ 1: ] ) ]
+                paint_last( out[ b * frames:( b + 1 ) * frames ], writes, unit_float( colors ), workers )
+
+        else:
+            for b in filled:
+                x0, y0, x1, y1, color_values = turtle_segments( batch_values[ b ], method, lv, mv, angle_scale, length_scale, start_x, start_y, width, height, boundary_behavior )
+                colors = map_colors( color_values, offset_list[ b ], lv, mv, lr, mr, lg, mg, lb, mb )
+                ends = frame_ends( len( x0 ), frames )
+                if line_width > 1:
+                    draw_wide_segments( out[ b * frames:( b + 1 ) * frames ], x0, y0, x1, y1, colors, line_width, workers, ends )
                 else:
-                    start_x, start_y = end_x, end_y
+                    draw_segments( out[ b * frames:( b + 1 ) * frames ], x0, y0, x1, y1, unit_float( colors ), workers, ends )
+
+        return ( result, )
+
+# --- Totalistic and life-like automata ---
+# Neighbourhood sums are window sums over a copy padded by the radius on every side, so the grid
+# wraps around like the elementary automaton. Small windows are added slice by slice; larger ones
+# are put together from windows of 1, 2, 4, ... cells, each made of two of the size before, so a
+# window of w cells takes about 2 log2( w ) additions.
+
+def window_sums( values, radius, axis, out=None ):
+    size = values.shape[ axis ] - 2 * radius
+    window = lambda array, start, stop: array[ ( slice( None ), ) * axis + ( slice( start, stop ), ) ]
+    if out is None:
+        out = np.empty( window( values, 0, size ).shape, dtype=values.dtype )
+    if radius <= 2:
+        np.add( window( values, 0, size ), window( values, 1, size + 1 ), out=out )
+        for start in range( 2, 2 * radius + 1 ):
+            out += window( values, start, start + size )
+        return out
+    # power holds the sums of span cells from every start; covered cells of the window are done
+    width = 2 * radius + 1
+    power = values
+    span = 1
+    covered = 0
+    while span <= width:
+        if width & span:
+            if covered:
+                out += window( power, covered, covered + size )
+            else:
+                np.copyto( out, window( power, 0, size ) )
+            covered += span
+        if span * 2 <= width:
+            length = power.shape[ axis ] - span
+            power = window( power, 0, length ) + window( power, span, span + length )
+        span *= 2
+    return out
+
+def sum_dtype( largest ):
+    return np.uint8 if largest <= 255 else np.uint16 if largest <= 65535 else np.uint32
+
+def count_ranges( counts ):
+    # Sorted counts as ( low, high ) runs, each tested with one subtraction and one comparison
+    ranges = []
+    for count in sorted( counts ):
+        if ranges and count == ranges[ -1 ][ 1 ] + 1:
+            ranges[ -1 ][ 1 ] = count
+        else:
+            ranges.append( [ count, count ] )
+    return [ tuple( r ) for r in ranges ]
+
+def in_ranges( sums, ranges, shift, found, offset, test ):
+    # found is set where sums - shift falls in any of the ranges; below the low end wraps to a
+    # large number. offset and test are scratch buffers shaped like sums.
+    found[ ... ] = False
+    for low, high in ranges:
+        np.subtract( sums, sums.dtype.type( low + shift ), out=offset )
+        np.less_equal( offset, high - low, out=test if len( ranges ) > 1 else found )
+        if len( ranges ) > 1:
+            found |= test
+    return found
+
+def parse_life_rule( rule, radius ):
+    # B/S notation such as B3/S23. Each digit is one neighbour count; wider neighbourhoods
+    # list counts with commas and ranges instead, e.g. B34-45/S33-57
+    largest = ( 2 * radius + 1 ) ** 2 - 1
+    parts = { }
+    for part in rule.replace( " ", "" ).upper( ).split( "/" ):
+        if not part or part[ 0 ] not in "BS" or part[ 0 ] in parts:
+            raise ValueError( f"Warning: [IntSeqAutomaton] Could not read the rule '{rule}'. Please use B/S notation, e.g. B3/S23." )
+        counts = set( )
+        body = part[ 1: ]
+        fields = body.split( "," ) if "," in body or "-" in body else list( body )
+        for field in filter( None, fields ):
+            low, _, high = field.partition( "-" )
+            if not ( low.isdigit( ) and ( high or low ).isdigit( ) ):
+                raise ValueError( f"Warning: [IntSeqAutomaton] Could not read the rule '{rule}'. Please use B/S notation, e.g. B3/S23." )
+            counts.update( range( int( low ), int( high or low ) + 1 ) )
+        if counts and max( counts ) > largest:
+            raise ValueError( f"Warning: [IntSeqAutomaton] Rule '{rule}' counts more than the {largest} neighbours a radius of {radius} has." )
+        parts[ part[ 0 ] ] = count_ranges( counts )
+    return parts.get( "B", [] ), parts.get( "S", [] )
+
+def parse_totalistic_rule( rule, states, radius ):
+    # Wolfram's code: digit n in base states is the next state when the neighbourhood, cell
+    # included, sums to n
+    sums = ( 2 * radius + 1 ) * ( states - 1 ) + 1
+    try:
+        code = int( rule.strip( ) )
+    except ValueError:
+        raise ValueError( f"Warning: [IntSeqAutomaton] Could not read the rule '{rule}'. Totalistic rules are a number, e.g. 1599." )
+    if not 0 <= code < states ** sums:
+        raise ValueError( f"Warning: [IntSeqAutomaton] Totalistic rules for {states} states and radius {radius} are between 0 and {states ** sums - 1}." )
+    digits = [ ]
+    for _ in range( sums ):
+        code, digit = divmod( code, states )
+        digits.append( digit )
+    return np.array( digits, dtype=np.uint8 )
 
-        return conv_pil_tensor( outimage )
+def run_totalistic( row, table, radius, height, age ):
+    # One generation per image row; with age each row holds how long every cell has been non-zero
+    states = np.empty( ( height, len( row ) ), dtype=np.uint16 if age else np.uint8 )
+    dtype = sum_dtype( ( 2 * radius + 1 ) * ( len( table ) - 1 ) )
+    current = row
+    ages = ( row > 0 ).astype( np.uint16 )
+    for y in range( height ):
+        if y:
+            padded = np.concatenate( ( current[ -radius: ], current, current[ :radius ] ) ).astype( dtype )
+            current = table[ window_sums( padded, radius, 0 ) ]
+            if age:
+                ages += 1
+                ages *= current > 0
+        states[ y ] = ages if age else current
+    return states
+
+def life_band( current, following, ages, y0, y1, radius, birth, survive, scratch ):
+    # Generation rows y0 to y1 of following from current, both 0 / 1 uint8 grids. scratch holds
+    # this band's buffers from one generation to the next.
+    height, width = current.shape
+    rows = y1 - y0 + 2 * radius
+    if not scratch:
+        # Row sums fit a smaller type than the full neighbourhood for wide radii
+        dtype = sum_dtype( ( 2 * radius + 1 ) ** 2 )
+        scratch[ "wrapped" ] = [ ( row, source % height ) for row, source in enumerate( range( y0 - radius, y1 + radius ) ) if not 0 <= source < height ]
+        scratch.update( padded=np.empty( ( rows, width + 2 * radius ), dtype=np.uint8 ), across=np.empty( ( rows, width ), dtype=np.uint8 ), sums=np.empty( ( y1 - y0, width ), dtype=dtype ) )
+        scratch.update( offset=np.empty_like( scratch[ "sums" ] ), born=np.empty( ( y1 - y0, width ), dtype=bool ), kept=np.empty( ( y1 - y0, width ), dtype=bool ), test=np.empty( ( y1 - y0, width ), dtype=bool ) )
+    padded = scratch[ "padded" ]
+    # Halo rows wrap around the grid, then the columns wrap inside the padded copy
+    for row, source in scratch[ "wrapped" ]:
+        padded[ row, radius:radius + width ] = current[ source ]
+    inside = slice( max( y0 - radius, 0 ), min( y1 + radius, height ) )
+    padded[ inside.start - ( y0 - radius ):inside.stop - ( y0 - radius ), radius:radius + width ] = current[ inside ]
+    padded[ :, :radius ] = padded[ :, width:width + radius ]
+    padded[ :, radius + width: ] = padded[ :, radius:2 * radius ]
+    across = window_sums( padded, radius, 1, scratch[ "across" ] )
+    sums = window_sums( across if across.dtype == scratch[ "sums" ].dtype else across.astype( scratch[ "sums" ].dtype ), radius, 0, scratch[ "sums" ] )
+    # The sums include the cell itself, so a living cell's neighbour counts are one lower
+    alive = current[ y0:y1 ].view( bool )
+    born = in_ranges( sums, birth, 0, scratch[ "born" ], scratch[ "offset" ], scratch[ "test" ] )
+    kept = in_ranges( sums, survive, 1, scratch[ "kept" ], scratch[ "offset" ], scratch[ "test" ] )
+    np.greater( born, alive, out=born )
+    kept &= alive
+    np.bitwise_or( born, kept, out=following[ y0:y1 ].view( bool ) )
+    if ages is not None:
+        band = ages[ y0:y1 ]
+        band += 1
+        band *= following[ y0:y1 ]
+
+def run_life( grid, birth, survive, radius, generations, age, workers ):
+    # Rows are stepped in bands small enough to stay in cache, spread over the workers
+    following = np.empty_like( grid )
+    ages = grid.astype( np.uint16 ) if age else None
+    bands = [ ( y0, y1, { } ) for y0, y1 in split_range( grid.shape[ 0 ], max( workers, grid.size // BAND_PIXELS ), 2 * radius + 1 ) ]
+
+    def step_band( band ):
+        y0, y1, scratch = band
+        life_band( grid, following, ages, y0, y1, radius, birth, survive, scratch )
+
+    for _ in range( generations ):
+        run_parallel( step_band, bands, workers )
+        grid, following = following, grid
+    return ages if age else grid
+
+class IntSeqAutomaton:
+    @classmethod
+    def INPUT_TYPES( cls ):
+        return {
+            "required": {
+                "width": ( "INT", { "default": 512, "min": 128, "max": 8192, "step": 8, "tooltip": "Width of the image" } ),
+                "height": ( "INT", { "default": 512, "min": 128, "max": 8192, "step": 8, "tooltip": "Height of the image" } ),
+                "sequence": ( "STRING", { "multiline": True, "default": "", "tooltip": "Enter a list of numbers separated by commas. It seeds the first row (1D) or the whole grid (2D), tiled" } ),
+                "method": ( [ "life-like 2D", "totalistic 1D" ], { "default": "life-like 2D" } ),
+                "rule": ( "STRING", { "default": "B3/S23", "tooltip": "[Life-like] B/S notation, e.g. B3/S23; wider neighbourhoods use counts and ranges, e.g. B34-45/S33-57 [Totalistic] Wolfram code, e.g. 1599 with 3 states" } ),
+                "states": ( "INT", { "default": 3, "min": 2, "max": 16, "step": 1, "tooltip": "[Totalistic] Number of cell states" } ),
+                "radius": ( "INT", { "default": 1, "min": 1, "max": 16, "step": 1, "tooltip": "Neighbourhood radius: cells counted on each side (1D) or the square around each cell (2D)" } ),
+                "generations": ( "INT", { "default": 100, "min": 0, "max": 10000, "step": 1, "tooltip": "[Life-like] Generations to run before rendering. 1D shows one generation per row instead" } ),
+                "render": ( [ "state", "age" ], { "default": "state", "tooltip": "state: colour by cell state. age: heatmap of how many generations each cell has been alive" } ),
+                "red_min": ( "INT", { "default": 0, "min": 0, "max": 255, "step": 1, "tooltip": "Colour of dead cells and the low end of the heatmap" } ),
+                "red_max": ( "INT", { "default": 255, "min": 0, "max": 255, "step": 1, "tooltip": "Colour of the highest state and the high end of the heatmap" } ),
+                "green_min": ( "INT", { "default": 0, "min": 0, "max": 255, "step": 1 } ),
+                "green_max": ( "INT", { "default": 255, "min": 0, "max": 255, "step": 1 } ),
+                "blue_min": ( "INT", { "default": 0, "min": 0, "max": 255, "step": 1 } ),
+                "blue_max": ( "INT", { "default": 255, "min": 0, "max": 255, "step": 1 } ),
+            },
+            "optional": {
+                "intseq": ( "INTSEQ", { "tooltip": "Sequence array from another IntSeq node (overrides sequence)" } ),
+                "workers": ( "INT", { "default": 1, "min": 0, "max": 256, "step": 1, "tooltip": "Threads that step and render row bands in parallel; 0 uses every core. Output is identical for any count" } ),
+            }
+        }
+
+    RETURN_TYPES = ( "IMAGE", )
+    FUNCTION = "generate_automaton"
+    CATEGORY = "IntSeq/image"
+
+    @cached_result( ignore=( "workers", ) )
+    def generate_automaton( self, width, height, sequence, method, rule, states, radius, generations, render, red_min, red_max, green_min, green_max, blue_min, blue_max, intseq=None, workers=1 ):
+        with NODE_STATS.phase( "parse" ):
+            try:
+                values = sequence_values( sequence, intseq )
+            except ValueError:
+                raise ValueError( "Warning: [IntSeqAutomaton] Could not parse all values. Please ensure it's a comma-separated list of numbers." )
+
+            if method == "totalistic 1D":
+                table = parse_totalistic_rule( rule, states, radius )
+            else:
+                birth, survive = parse_life_rule( rule, radius )
+                states = 2
+
+        with NODE_STATS.phase( "convert" ):
+            result = torch.zeros( ( 1, height, width, 3 ), dtype=torch.float32 )
+            out = result.numpy( )[ 0 ]
+        if not len( values ):
+            return ( result, )
+
+        age = render == "age"
+        workers = resolve_workers( workers )
+        if method == "totalistic 1D":
+            cells = run_totalistic( automaton_seed( values, width, states ), table, radius, height, age )
+        else:
+            cells = run_life( automaton_seed( values, width * height ).reshape( height, width ), birth, survive, radius, generations, age, workers )
+
+        low = np.array( [ red_min, green_min, blue_min ], dtype=np.float64 )
+        high = np.array( [ red_max, green_max, blue_max ], dtype=np.float64 )
+        # States take evenly spaced colours from low to high; ages are scaled so the oldest cell gets high
+        levels = max( int( cells.max( ) ), 1 ) if age else states - 1
+        palette = unit_float( ( low + ( high - low ) * np.arange( levels + 1 )[ :, None ] / levels ).astype( np.uint8 ) )
+
+        def paint_rows( rows ):
+            y0, y1 = rows
+            np.take( palette, cells[ y0:y1 ], axis=0, out=out[ y0:y1 ] )
+
+        with NODE_STATS.phase( "convert" ):
+            run_parallel( paint_rows, split_range( height, max( workers, height // band_rows( width ) ) ), workers )
+
+        return ( result, )
+
+def pchip_slopes( values, index ):
+    # Monotone cubic ( Fritsch-Carlson ) slopes at the given indices of evenly spaced values. Only
+    # the neighbouring differences are read, so a long sequence needs no full slope array.
+    last = len( values ) - 1
+    left = values[ np.clip( index, 1, last ) ] - values[ np.clip( index, 1, last ) - 1 ]
+    right = values[ np.clip( index, 0, last - 1 ) + 1 ] - values[ np.clip( index, 0, last - 1 ) ]
+    with np.errstate( divide="ignore", invalid="ignore" ):
+        slopes = np.where( left * right > 0, 2 / ( 1 / left + 1 / right ), 0.0 )
+    # The end points use the three point estimate, kept to the sign of the first difference
+    for end, near, far in ( ( 0, values[ 1 ] - values[ 0 ], values[ 2 ] - values[ 1 ] ), ( last, values[ last ] - values[ last - 1 ], values[ last - 1 ] - values[ last - 2 ] ) ):
+        slope = ( 3 * near - far ) / 2
+        if np.sign( slope ) != np.sign( near ):
+            slope = 0.0
+        elif np.sign( near ) != np.sign( far ) and abs( slope ) > abs( 3 * near ):
+            slope = 3 * near
+        slopes[ index == end ] = slope
+    return slopes
+
+def resample_values( values, steps, mode ):
+    # linear and cubic interpolate steps evenly spaced points along the sequence; percentile takes
+    # the values at steps evenly spaced percentiles instead, lowest first
+    if mode == "percentile":
+        return np.quantile( values, np.linspace( 0.0, 1.0, steps ) )
+    if len( values ) < 2:
+        return np.full( steps, values[ 0 ] )
+    position = np.linspace( 0.0, len( values ) - 1, steps )
+    index = np.minimum( position.astype( np.int64 ), len( values ) - 2 )
+    t = position - index
+    start, end = values[ index ], values[ index + 1 ]
+    if mode == "linear" or len( values ) < 3:
+        return start + t * ( end - start )
+    return ( 2 * t**3 - 3 * t**2 + 1 ) * start + ( t**3 - 2 * t**2 + t ) * pchip_slopes( values, index ) + ( 3 * t**2 - 2 * t**3 ) * end + ( t**3 - t**2 ) * pchip_slopes( values, index + 1 )
 
 class IntSeqSigmas:
     @classmethod
@@ -253,12 +1269,17 @@ class IntSeqSigmas:
         return {
             "required": {
                 "sequence": ( "STRING", { "multiline": True, "default": "", "tooltip": "Enter a list of numbers separated by commas" } ),
-                "count": ( "INT", { "default": 0, "min": 0, "max": 4096, "step": 1, "tooltip": "How many numbers to use from the start of the sequence (0 for all)" } ),
+                "count": ( "INT", { "default": 0, "min": 0, "max": 10000000, "step": 1, "tooltip": "How many numbers to use from the start of the sequence (0 for all)" } ),
                 "new_minimum": ( "FLOAT", { "default": 0.0, "min": -10000.0, "max": 10000.0, "step": 0.01, "tooltip": "The new lowest value in the output range" } ),
                 "new_maximum": ( "FLOAT", { "default": 20.0, "min": -10000.0, "max": 10000.0, "step": 0.01, "tooltip": "The new highest value in the output range" } ),
                 "reverse": ( "BOOLEAN", { "default": True } ),
                 "sort_order": ( [ "no sort", "highest to lowest", "lowest to highest" ], { "default": "no sort" } ),
             },
+            "optional": {
+                "intseq": ( "INTSEQ", { "tooltip": "Sequence array from another IntSeq node (overrides sequence)" } ),
+                "steps": ( "INT", { "default": 0, "min": 0, "max": 10000000, "step": 1, "tooltip": "Resample the sequence to this many sigmas (0 to keep every value)" } ),
+                "resample": ( [ "linear", "cubic", "percentile" ], { "default": "linear", "tooltip": "[Steps] Interpolate along the sequence (cubic keeps it monotone between values), or take evenly spaced percentiles of its values" } ),
+            }
         }
 
     RETURN_TYPES = ( "SIGMAS", )
@@ -266,38 +1287,122 @@ class IntSeqSigmas:
     FUNCTION = "map_sequence"
     CATEGORY = "IntSeq/sigmas"
 
-    def map_sequence( self, sequence, count, new_minimum, new_maximum, reverse, sort_order ):
+    def map_sequence( self, sequence, count, new_minimum, new_maximum, reverse, sort_order, intseq=None, steps=0, resample="linear" ):
         try:
-            value_list = [ float( x.strip() ) for x in sequence.split( ',' ) if x.strip() ]
+            with NODE_STATS.phase( "parse" ):
+                values = sequence_values( sequence, intseq, count or None )
         except ValueError:
             print( "Warning: [IntSeqSigmas] Could not parse all values. Please ensure it's a comma-separated list of numbers." )
             return ( torch.empty( 0 ), )
 
-        if not value_list:
+        if not len( values ):
             print( "Warning: [IntSeqSigmas] Input value list is empty." )
             return ( torch.empty( 0 ), )
 
-        val_subset = value_list[ :count ] if 0 < count <= len( value_list ) else value_list
+        values = values[ :count ] if count > 0 else values
+
+        # Percentiles come out lowest first, so they are taken before the sort order is applied
+        if steps and resample == "percentile":
+            values = resample_values( values, steps, resample )
 
         if sort_order == "highest to lowest":
-            val_subset.sort( reverse=True )
+            values = np.sort( values )[ ::-1 ]
         elif sort_order == "lowest to highest":
-            val_subset.sort( reverse=False )
+            values = np.sort( values )
 
         if reverse:
-            val_subset.reverse( )
+            values = values[ ::-1 ]
 
-        if not val_subset:
-            return ( torch.empty( 0 ), )
+        if steps and resample != "percentile":
+            values = resample_values( values, steps, resample )
 
-        original_minimum = min( val_subset )
-        original_maximum = max( val_subset )
+        original_minimum = values.min( )
+        original_maximum = values.max( )
 
-        mapped_values = [ remap( x, original_minimum, original_maximum, new_minimum, new_maximum ) for x in val_subset ]
-        sigmas_tensor = torch.tensor( mapped_values, dtype=torch.float32, device='cpu' )
+        if original_minimum == original_maximum:
+            mapped_values = np.full( len( values ), new_minimum )
+        else:
+            mapped_values = remap( values, original_minimum, original_maximum, new_minimum, new_maximum )
+        with NODE_STATS.phase( "convert" ):
+            sigmas_tensor = torch.from_numpy( mapped_values.astype( np.float32 ) )
 
         return ( sigmas_tensor, )
 
+@functools.lru_cache( maxsize=1 )
+def agg_backend( ):
+    # matplotlib is only imported the first time a plot is drawn, and never through pyplot's global state
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    return Figure, FigureCanvasAgg
+
+def agg_plot( values, title, xlabel, ylabel, width, height ):
+    Figure, FigureCanvasAgg = agg_backend( )
+    fig = Figure( figsize=( width / 100, height / 100 ), dpi=100 )
+    canvas = FigureCanvasAgg( fig )
+    ax = fig.add_subplot( )
+    ax.plot( values )
+    ax.set_title( title )
+    ax.set_xlabel( xlabel )
+    ax.set_ylabel( ylabel )
+    ax.grid( True )
+    canvas.draw( )
+    # buffer_rgba is a view of the Agg renderer; only the float conversion copies it
+    return unit_float( np.asarray( canvas.buffer_rgba( ) )[ ..., :3 ] )
+
+# matplotlib's default line colour and the frame drawn around the fast plot
+PLOT_LINE = unit_float( np.array( ( 0x1f, 0x77, 0xb4 ), dtype=np.uint8 ) )
+PLOT_FRAME = np.zeros( 3, dtype=np.float32 )
+
+def decimated_plot( values, width, height ):
+    # Line plot without matplotlib. Sequences longer than the plot is wide keep only the first, last,
+    # minimum and maximum value of each pixel column, which draws the same envelope as every point.
+    canvas = np.ones( ( height, width, 3 ), dtype=np.float32 )
+    left, right = round( width * 0.08 ), width - 1 - round( width * 0.05 )
+    top, bottom = round( height * 0.05 ), height - 1 - round( height * 0.08 )
+    frame_x = np.array( [ left, right, right, left ], dtype=np.float64 )
+    frame_y = np.array( [ top, top, bottom, bottom ], dtype=np.float64 )
+    draw_segments( canvas, frame_x, frame_y, np.roll( frame_x, -1 ), np.roll( frame_y, -1 ), np.tile( PLOT_FRAME, ( 4, 1 ) ) )
+
+    values = np.asarray( values, dtype=np.float64 )
+    finite = np.isfinite( values )
+    if not finite.any( ):
+        return canvas
+    low, high = values[ finite ].min( ), values[ finite ].max( )
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    # The data fills the frame less a 5% margin on each side, like matplotlib's default axes margins
+    pad_x, pad_y = ( right - left ) * 0.05, ( bottom - top ) * 0.05
+    span_x = right - left - 2 * pad_x
+    x = left + pad_x + ( np.arange( len( values ) ) * span_x / max( len( values ) - 1, 1 ) )
+    y = bottom - pad_y - ( values - low ) * ( bottom - top - 2 * pad_y ) / ( high - low )
+
+    if len( values ) > span_x:
+        # Column of every value, then per column the first, last, lowest and highest finite value
+        column = np.trunc( x ).astype( np.int64 )
+        column = column[ finite ]
+        y = y[ finite ]
+        starts = np.flatnonzero( np.diff( column, prepend=column[ 0 ] - 1 ) )
+        ends = np.append( starts[ 1: ], len( column ) ) - 1
+        x = column[ starts ].astype( np.float64 )
+        top_y = np.minimum.reduceat( y, starts )
+        bottom_y = np.maximum.reduceat( y, starts )
+        # A vertical stroke per column, and a link from each column's last value to the next one's first
+        x0 = np.concatenate( ( x, x[ :-1 ] ) )
+        y0 = np.concatenate( ( top_y, y[ ends[ :-1 ] ] ) )
+        x1 = np.concatenate( ( x, x[ 1: ] ) )
+        y1 = np.concatenate( ( bottom_y, y[ starts[ 1: ] ] ) )
+    else:
+        # Every value is its own point; non-finite values break the line, as in matplotlib
+        link = finite[ :-1 ] & finite[ 1: ]
+        lone = finite & ~np.concatenate( ( [ False ], link ) ) & ~np.concatenate( ( link, [ False ] ) )
+        x0 = np.concatenate( ( x[ :-1 ][ link ], x[ lone ] ) )
+        y0 = np.concatenate( ( y[ :-1 ][ link ], y[ lone ] ) )
+        x1 = np.concatenate( ( x[ 1: ][ link ], x[ lone ] ) )
+        y1 = np.concatenate( ( y[ 1: ][ link ], y[ lone ] ) )
+
+    draw_segments( canvas, x0, y0, x1, y1, np.tile( PLOT_LINE, ( len( x0 ), 1 ) ) )
+    return canvas
+
 class IntSeqPlotter:
     @classmethod
     def INPUT_TYPES( cls ):
@@ -307,6 +1412,12 @@ class IntSeqPlotter:
                 "title": ( "STRING", { "default": "Sequence Plot " } ),
                 "xlabel": ( "STRING", { "default": "Index" } ),
                 "ylabel": ( "STRING", { "default": "Value" } ),
+            },
+            "optional": {
+                "intseq": ( "INTSEQ", { "tooltip": "Sequence array from another IntSeq node (overrides sequence)" } ),
+                "renderer": ( [ "matplotlib", "fast" ], { "default": "matplotlib", "tooltip": "fast draws the line alone with NumPy, reducing huge sequences to the min and max of each pixel column. No title, labels or ticks" } ),
+                "width": ( "INT", { "default": 640, "min": 128, "max": 8192, "step": 8, "tooltip": "Width of the plot image" } ),
+                "height": ( "INT", { "default": 480, "min": 128, "max": 8192, "step": 8, "tooltip": "Height of the plot image" } ),
             }
         }
 
@@ -314,33 +1425,23 @@ class IntSeqPlotter:
     FUNCTION = "plot_sequence"
     CATEGORY = "IntSeq/plot"
 
-    def plot_sequence( self, sequence, title, xlabel, ylabel ):
+    @cached_result( )
+    def plot_sequence( self, sequence, title, xlabel, ylabel, intseq=None, renderer="matplotlib", width=640, height=480 ):
         try:
-            values = [ float( x.strip() ) for x in sequence.split( ',' ) if x.strip() ]
+            with NODE_STATS.phase( "parse" ):
+                values = sequence_values( sequence, intseq )
         except ValueError:
             raise ValueError( "Warning: [IntSeqPlotter] Could not parse all values. Please ensure it's a comma-separated list of numbers." )
 
-        if not values:
+        if not len( values ):
             return ( torch.zeros( ( 1, 100, 100, 3 ), dtype=torch.float32 ), )
 
-        fig, ax = plt.subplots( )
-        ax.plot( values )
-        ax.set_title( title )
-        ax.set_xlabel( xlabel )
-        ax.set_ylabel( ylabel )
-        ax.grid( True )
-        
-        buf = io.BytesIO( )
-        plt.savefig( buf, format='png' )
-        plt.close( fig )
-        buf.seek( 0 )
-        
-        image = Image.open( buf )
-        image = image.convert( "RGB" )
-        image_np = np.array( image ).astype( np.float32 ) / 255.0
-        image_tensor = torch.from_numpy( image_np ).unsqueeze( 0 )
-        
-        return ( image_tensor, )
+        if renderer == "fast":
+            image = decimated_plot( values, width, height )
+        else:
+            image = agg_plot( values, title, xlabel, ylabel, width, height )
+        with NODE_STATS.phase( "convert" ):
+            return ( torch.from_numpy( image ).unsqueeze( 0 ), )
 
 class IntSeqWave:
     @classmethod
@@ -348,78 +1449,34 @@ class IntSeqWave:
         return {
             "required": {
                 "type": ( [ "sine", "cosine", "tangent", "cotangent", "sawtooth", "triangle", "sigmoid", "square" ], { "default": "sine" } ),
-                "length": ( "INT", { "default": 100, "min": 1, "max": 10000, "step": 1, "tooltip": "Number of values in the wave LUT" } ),
+                "length": ( "INT", { "default": 100, "min": 1, "max": 10000000, "step": 1, "tooltip": "Number of values in the wave LUT" } ),
                 "amplitude": ( "FLOAT", { "default": 1.0, "min": 0.0, "max": 1000.0, "step": 0.01, "tooltip": "Amplitude of the wave" } ),
                 "frequency": ( "FLOAT", { "default": 1.0, "min": 0.01, "max": 100.0, "step": 0.01, "tooltip": "Frequency of the wave (number of cycles)" } ),
                 "phase_offset": ( "FLOAT", { "default": 0.0, "min": -360.0, "max": 360.0, "step": 0.1, "tooltip": "Phase offset in degrees" } ),
                 "vertical_offset": ( "FLOAT", { "default": 0.0, "min": -1000.0, "max": 1000.0, "step": 0.01, "tooltip": "Vertical offset of the wave" } ),
                 "slope": ( "FLOAT", { "default": 0.0, "min": -29.0, "max": 29.0, "step": 0.01, "tooltip": "[Sigmoid]Slope of the wave" } ),
                 "duty_cycle": ( "FLOAT", { "default": 0.0, "min": -1000.0, "max": 1000.0, "step": 0.01, "tooltip": "[Triangle Sawtooth Square]Duty cycle of the wave" } ),
+            },
+            "optional": {
+                "format_text": ( "BOOLEAN", { "default": True, "tooltip": "Also write the wave to the SEQUENCE text output; turn off for very long waves" } ),
             }
         }
 
-    RETURN_TYPES = ( "STRING", )
-    RETURN_NAMES = ( "SEQUENCE", )
+    RETURN_TYPES = ( "STRING", "INTSEQ", )
+    RETURN_NAMES = ( "SEQUENCE", "INTSEQ", )
     FUNCTION = "generate_wave_sequence"
     CATEGORY = "IntSeq/generator"
 
-    def generate_wave_sequence( self, type, length, amplitude, frequency, phase_offset, vertical_offset, slope, duty_cycle ):
-        values = []
-        phase_rad = math.radians( phase_offset )
-
-        for i in range( length ):
-            t = ( i / length ) * ( 2 * math.pi * frequency ) + phase_rad
-            
-            if type == "sine":
-                value = amplitude * math.sin( t ) + vertical_offset
-            elif type == "cosine":
-                value = amplitude * math.cos( t ) + vertical_offset
-            elif type == "tangent":
-                try:
-                    tan_val = math.tan( t )
-                    value = amplitude * math.atan( tan_val ) * ( 2 / math.pi ) + vertical_offset
-                except ValueError:
-                    value = float( 'nan' )
-            elif type == "cotangent":
-                try:
-                    cot_val = 1 / math.tan( t )
-                    value = amplitude * math.atan( cot_val ) * ( 2 / math.pi ) + vertical_offset
-                except ( ValueError, ZeroDivisionError ):
-                    value = float( 'nan' )
-            elif type == "sawtooth":
-                normalized_t = ( t / ( 2 * math.pi ) ) % 1
-                if normalized_t < duty_cycle:
-                    value = amplitude * ( normalized_t / duty_cycle ) - amplitude / 2
-                else:
-                    value = amplitude * ( ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) ) - amplitude / 2
-                value += vertical_offset
-            elif type == "triangle":
-                normalized_t = ( t / ( 2 * math.pi ) ) % 1
-                if normalized_t < duty_cycle:
-                    value = amplitude * ( 2 * normalized_t / duty_cycle - 1 )
-                else:
-                    value = amplitude * ( 1 - 2 * ( normalized_t - duty_cycle ) / ( 1 - duty_cycle ) )
-                value += vertical_offset
-            elif type == "sigmoid":
-                sigmoid_input = remap( t, 0, 2 * math.pi * frequency, -6 * frequency, 6 * frequency ) * slope
-                value = amplitude * ( 1 / ( 1 + math.exp( -sigmoid_input ) ) ) + vertical_offset - amplitude / 2
-            elif type == "square":
-                normalized_t = ( t / ( 2 * math.pi ) ) % 1
-                if normalized_t < duty_cycle:
-                    value = amplitude + vertical_offset
-                else:
-                    value = -amplitude + vertical_offset
-            else:
-                value = 0
-            
-            values.append( value )
+    @cached_result( )
+    def generate_wave_sequence( self, type, length, amplitude, frequency, phase_offset, vertical_offset, slope, duty_cycle, format_text=True ):
+        values = wave_values( type, length, amplitude, frequency, phase_offset, vertical_offset, slope, duty_cycle )
 
-        if any( math.isnan( v ) for v in values ):
+        if np.isnan( values ).any( ):
             print( f"Warning: [IntSeqWave] Generated NaN values for wave type '{type}'. These will be converted to 0." )
-            values = [ v if not math.isnan( v ) else 0 for v in values ]
-
+            values = np.nan_to_num( values, nan=0.0 )
 
-        return ( ",".join( map( str, values ) ), )
+        with NODE_STATS.phase( "convert" ):
+            return ( format_values( values ) if format_text else "", values, )
         
 class SigmasToIntSeq:
     @classmethod
@@ -427,38 +1484,582 @@ class SigmasToIntSeq:
         return {
             "required": {
                 "sigmas": ( "SIGMAS", ),
+            },
+            "optional": {
+                "format_text": ( "BOOLEAN", { "default": True, "tooltip": "Also write the sigmas to the SEQUENCE text output; turn off when only the INTSEQ output is used" } ),
             }
         }
 
-    RETURN_TYPES = ( "STRING", )
-    RETURN_NAMES = ( "SEQUENCE", )
+    RETURN_TYPES = ( "STRING", "INTSEQ", )
+    RETURN_NAMES = ( "SEQUENCE", "INTSEQ", )
     FUNCTION = "convert_to_sequence"
     CATEGORY = "IntSeq/sigmas"
 
-    def convert_to_sequence( self, sigmas ):
+    def convert_to_sequence( self, sigmas, format_text=True ):
         if sigmas is None:
-            return ( "", )
-        
-        sequence_list = sigmas.cpu().numpy().tolist()
-        
-        sequence_str = ", ".join( map( str, sequence_list ) )
-        
-        return ( sequence_str, )
+            return ( "", np.empty( 0, dtype=np.float64 ), )
+
+        with NODE_STATS.phase( "parse" ):
+            values = sigmas.cpu().numpy().astype( np.float64 )
+
+        with NODE_STATS.phase( "convert" ):
+            return ( format_values( values, ", " ) if format_text else "", values, )
+
+class IntSeqCacheStats:
+    @classmethod
+    def INPUT_TYPES( cls ):
+        return {
+            "required": {
+                "clear": ( "BOOLEAN", { "default": False, "tooltip": "Empty the in-memory result cache after reading the counters" } ),
+            }
+        }
+
+    RETURN_TYPES = ( "STRING", )
+    RETURN_NAMES = ( "STATS", )
+    FUNCTION = "cache_stats"
+    CATEGORY = "IntSeq/utils"
+
+    @classmethod
+    def IS_CHANGED( cls, clear ):
+        # The counters change between runs even when the input does not
+        return float( "nan" )
+
+    def cache_stats( self, clear ):
+        stats = RESULT_CACHE.stats( )
+        if NODE_STATS.enabled:
+            stats[ "nodes" ] = NODE_STATS.summary( )
+        if clear:
+            RESULT_CACHE.clear( )
+        return ( json.dumps( stats, indent=2 ), )
+
+FIELD_SPLIT = re.compile( r'[\s,;]+' )
+
+def number_fields( text ):
+    # Whitespace-separated numbers. np.fromstring only warns on a bad field, so that falls back
+    # to float( ), which raises.
+    with warnings.catch_warnings( ):
+        warnings.simplefilter( "error" )
+        try:
+            return np.fromstring( text, dtype=np.float64, sep=" " )
+        except ( ValueError, DeprecationWarning ):
+            return np.array( [ float( field ) for field in text.split( ) ], dtype=np.float64 )
+
+def text_values( path, csv, column, offset, count ):
+    # Reads about a megabyte of lines at a time and stops once offset + count values are in, so a
+    # window near the start of a huge file never reads the rest. Lines starting with # are comments.
+    # column picks one field per line, as in an OEIS b-file's "n a(n)" lines; -1 keeps every field.
+    chunks = []
+    skip = offset
+    wanted = count or None
+    first = True
+    with open( path, encoding="utf-8" ) as file:
+        while wanted is None or wanted > 0:
+            lines = file.readlines( 1 << 20 )
+            if not lines:
+                break
+            lines = [ line for line in lines if line.strip( ) and not line.lstrip( ).startswith( "#" ) ]
+            if csv and first and lines:
+                # A header row is any first row that is not all numbers
+                try:
+                    [ float( field ) for field in FIELD_SPLIT.split( lines[ 0 ].strip( ) ) ]
+                except ValueError:
+                    lines = lines[ 1: ]
+            first = False
+            if column >= 0:
+                rows = [ FIELD_SPLIT.split( line.strip( ) ) for line in lines ]
+                chunk = number_fields( " ".join( row[ column ] for row in rows if len( row ) > column ) )
+            else:
+                chunk = number_fields( FIELD_SPLIT.sub( " ", "".join( lines ) ) )
+            dropped = min( skip, len( chunk ) )
+            chunk = chunk[ dropped: ][ :wanted ]
+            skip -= dropped
+            if wanted is not None:
+                wanted -= len( chunk )
+            chunks.append( chunk )
+    return np.concatenate( chunks ) if chunks else np.empty( 0, dtype=np.float64 )
+
+LOADER_FORMATS = { ".npy": "npy", ".bin": "int64", ".raw": "int64", ".i64": "int64", ".csv": "csv" }
+
+def resolve_path( path ):
+    path = os.path.expanduser( path.strip( ).strip( '"' ) )
+    if not os.path.isabs( path ):
+        # Inside ComfyUI, relative paths are looked up in the input directory first
+        try:
+            import folder_paths
+            candidate = os.path.join( folder_paths.get_input_directory( ), path )
+            if os.path.exists( candidate ):
+                return candidate
+        except ImportError:
+            pass
+    return path
+
+def load_values( path, format, offset, count, column ):
+    if format == "auto":
+        format = LOADER_FORMATS.get( os.path.splitext( path )[ 1 ].lower( ), "text" )
+    if format in ( "text", "csv" ):
+        return text_values( path, format == "csv", column, offset, count )
+    # Binary formats are memory-mapped and sliced, so only the window is ever read from disk
+    if format == "npy":
+        values = np.load( path, mmap_mode="r" )
+        values = values.reshape( -1 ) if values.flags.c_contiguous else values.ravel( )
+    else:
+        values = np.memmap( path, dtype="<i8", mode="r" )
+    return values[ offset:offset + count if count else None ]
+
+class IntSeqLoader:
+    @classmethod
+    def INPUT_TYPES( cls ):
+        return {
+            "required": {
+                "path": ( "STRING", { "default": "", "tooltip": "Sequence file. Relative paths are looked up in the ComfyUI input folder" } ),
+                "format": ( [ "auto", "text", "csv", "npy", "int64" ], { "default": "auto", "tooltip": "auto picks by extension: .npy, .bin/.raw/.i64 (raw little-endian int64), .csv, anything else is text" } ),
+                "offset": ( "INT", { "default": 0, "min": 0, "max": 0xffffffffffffffff, "step": 1, "tooltip": "Number of values to skip from the start of the file" } ),
+                "count": ( "INT", { "default": 0, "min": 0, "max": 0xffffffffffffffff, "step": 1, "tooltip": "How many values to load after the offset (0 for all)" } ),
+                "column": ( "INT", { "default": -1, "min": -1, "max": 1024, "step": 1, "tooltip": "[Text/CSV] Field to take from each line, e.g. 1 for OEIS b-files (-1 for every field)" } ),
+            }
+        }
+
+    RETURN_TYPES = ( "INTSEQ", "INT", )
+    RETURN_NAMES = ( "INTSEQ", "COUNT", )
+    FUNCTION = "load_sequence"
+    CATEGORY = "IntSeq/generator"
+
+    @classmethod
+    def IS_CHANGED( cls, path, format, offset, count, column ):
+        # Reload when the file itself changes, not only the inputs
+        try:
+            stat = os.stat( resolve_path( path ) )
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            return float( "nan" )
+
+    def load_sequence( self, path, format, offset, count, column ):
+        path = resolve_path( path )
+        try:
+            with NODE_STATS.phase( "parse" ):
+                values = load_values( path, format, offset, count, column )
+        except OSError as error:
+            raise ValueError( f"Warning: [IntSeqLoader] Could not read {path}: {error}" )
+        except ValueError:
+            raise ValueError( f"Warning: [IntSeqLoader] Could not parse all values in {path}. Please ensure it only holds numbers." )
+
+        return ( values, len( values ), )
+
+# --- Integer sequence generators ---
+# Every generator returns the terms with indices start to start + count - 1. The expensive ones keep
+# the longest prefix they have built so far, so later windows and longer requests start from there.
+
+SIEVE_SEGMENT = 1 << 22
+
+class PrimeTable:
+    # Primes found so far, grown by sieving odd numbers one segment at a time past the last limit
+    def __init__( self ):
+        self.primes = np.array( [ 2, 3, 5, 7, 11, 13 ], dtype=np.int64 )
+        self.limit = 16
+        self.lock = threading.Lock( )
+
+    def grow( self, limit ):
+        # Base primes up to sqrt( limit ) come from the table itself, growing it first if needed
+        root = math.isqrt( limit ) + 1
+        if root > self.limit:
+            self.grow( root )
+        base = self.primes[ 1:np.searchsorted( self.primes, root, side="right" ) ]
+        found = [ self.primes ]
+        low = self.limit | 1
+        while low < limit:
+            high = min( low + 2 * SIEVE_SEGMENT, limit )
+            # Odd numbers low, low + 2, ... below high
+            is_prime = np.ones( ( high - low + 1 ) // 2, dtype=bool )
+            for p in base.tolist( ):
+                if p * p >= high:
+                    break
+                first = max( p * p, -( -low // p ) * p )
+                if not first & 1:
+                    first += p
+                is_prime[ ( first - low ) // 2::p ] = False
+            found.append( low + 2 * np.flatnonzero( is_prime ).astype( np.int64 ) )
+            low = high | 1
+        self.primes = np.concatenate( found )
+        self.limit = max( self.limit, limit )
+
+    def first( self, count ):
+        with self.lock:
+            while len( self.primes ) < count:
+                # p_n < n ( ln n + ln ln n ) for n >= 6
+                n = max( count, 6 )
+                self.grow( max( int( n * ( math.log( n ) + math.log( math.log( n ) ) ) ) + 1, 2 * self.limit ) )
+            return self.primes[ :count ]
+
+PRIMES = PrimeTable( )
+
+# The prime table and the Recaman prefix stay in memory once built, so both stop at this index
+TABLE_LIMIT = 10000000
+
+def prime_terms( start, count ):
+    if start + count > TABLE_LIMIT:
+        raise ValueError( f"Warning: [IntSeqGenerator] Primes are available up to index {TABLE_LIMIT:,}." )
+    return PRIMES.first( start + count )[ start: ].copy( )
+
+def thue_morse_terms( start, count ):
+    # Parity of the number of set bits of the index
+    n = np.arange( start, start + count, dtype=np.uint64 )
+    for shift in ( 32, 16, 8, 4, 2, 1 ):
+        n ^= n >> np.uint64( shift )
+    return ( n & np.uint64( 1 ) ).astype( np.int64 )
+
+COLLATZ_TABLE_LIMIT = 1 << 24
+
+class CollatzTable:
+    # Steps to reach 1 for every n below the table's length, built in blocks that finish each
+    # trajectory by a lookup as soon as it drops below the block
+    def __init__( self ):
+        self.steps = np.array( [ 0, 0 ], dtype=np.int32 )
+        self.lock = threading.Lock( )
+
+    def trajectories( self, n ):
+        # Steps from each n until it falls below the table, plus the table's count from there
+        n = n.copy( )
+        steps = np.zeros( len( n ), dtype=np.int64 )
+        active = np.flatnonzero( n >= len( self.steps ) )
+        limit = ( np.iinfo( np.int64 ).max - 1 ) // 3
+        while active.size:
+            current = n[ active ]
+            if ( current > limit ).any( ):
+                raise ValueError( "Warning: [IntSeqGenerator] A Collatz trajectory left the 64-bit range." )
+            odd = ( current & 1 ).astype( bool )
+            n[ active ] = np.where( odd, 3 * current + 1, current >> 1 )
+            steps[ active ] += 1
+            active = active[ n[ active ] >= len( self.steps ) ]
+        return steps + self.steps[ n ]
+
+    def grow( self, size ):
+        with self.lock:
+            while len( self.steps ) < size:
+                low = len( self.steps )
+                high = min( max( 2 * low, 1 << 16 ), size )
+                self.steps = np.concatenate( ( self.steps, self.trajectories( np.arange( low, high, dtype=np.int64 ) ).astype( np.int32 ) ) )
+
+    def lengths( self, n ):
+        self.grow( min( int( n.max( ) ) + 1, COLLATZ_TABLE_LIMIT ) )
+        return self.trajectories( n )
+
+COLLATZ = CollatzTable( )
+
+def collatz_terms( start, count ):
+    # Term i is the number of steps that take i + 1 to 1
+    if not count:
+        return np.empty( 0, dtype=np.int64 )
+    return COLLATZ.lengths( np.arange( start + 1, start + count + 1, dtype=np.int64 ) )
+
+class RecamanTable:
+    # a( 0 ) = 0, a( n ) = a( n - 1 ) - n if that is positive and new, else a( n - 1 ) + n. Each term
+    # depends on every earlier one, so this is a plain loop that keeps the prefix and the seen set.
+    def __init__( self ):
+        self.terms = array.array( "q", [ 0 ] )
+        self.seen = bytearray( 1 )
+        self.seen[ 0 ] = 1
+        self.lock = threading.Lock( )
+
+    def window( self, start, count ):
+        with self.lock:
+            terms = self.terms
+            seen = self.seen
+            value = terms[ -1 ]
+            for n in range( len( terms ), start + count ):
+                value = value - n if value > n and not seen[ value - n ] else value + n
+                if value >= len( seen ):
+                    seen.extend( bytes( max( value + 1 - len( seen ), len( seen ) ) ) )
+                seen[ value ] = 1
+                terms.append( value )
+            # A copy, since the prefix cannot grow while a view of it exists
+            return np.array( terms[ start:start + count ], dtype=np.int64 )
+
+RECAMAN = RecamanTable( )
+
+def recaman_terms( start, count ):
+    if start + count > TABLE_LIMIT:
+        raise ValueError( f"Warning: [IntSeqGenerator] Recaman terms are available up to index {TABLE_LIMIT:,}." )
+    return RECAMAN.window( start, count )
+
+def matrix_multiply( a, b, modulus ):
+    product = [ [ sum( a[ i ][ k ] * b[ k ][ j ] for k in range( len( b ) ) ) for j in range( len( b[ 0 ] ) ) ] for i in range( len( a ) ) ]
+    return [ [ x % modulus for x in row ] for row in product ] if modulus else product
+
+@functools.lru_cache( maxsize=256 )
+def companion_power( coefficients, modulus, bit ):
+    # The companion matrix of a( n ) = c1 a( n - 1 ) + ... + ck a( n - k ) raised to 2 ** bit,
+    # memoized so windows of the same recurrence share their squarings
+    if bit == 0:
+        k = len( coefficients )
+        matrix = [ list( coefficients ) ] + [ [ int( i == j ) for j in range( k ) ] for i in range( k - 1 ) ]
+        return tuple( tuple( x % modulus if modulus else x for x in row ) for row in matrix )
+    half = companion_power( coefficients, modulus, bit - 1 )
+    return tuple( map( tuple, matrix_multiply( half, half, modulus ) ) )
+
+RECURRENCE_START_LIMIT = 1000000
+
+def recurrence_terms( coefficients, initial, modulus, start, count ):
+    k = len( coefficients )
+    if not modulus and start > RECURRENCE_START_LIMIT:
+        raise ValueError( f"Warning: [IntSeqGenerator] Recurrences starting past index {RECURRENCE_START_LIMIT:,} need a modulus." )
+    # state is ( a( n + k - 1 ), ..., a( n ) ), exact Python integers up to the window's start
+    state = [ [ x % modulus if modulus else x ] for x in reversed( initial ) ]
+    offset = start
+    bit = 0
+    while offset:
+        if offset & 1:
+            state = matrix_multiply( companion_power( coefficients, modulus, bit ), state, modulus )
+        offset >>= 1
+        bit += 1
+    state = [ row[ 0 ] for row in state ]
+    if count <= k:
+        return finish_recurrence( state[ ::-1 ][ :count ], modulus )
+
+    # Term j of every block of length b is the same combination of the block's first k terms. rows
+    # holds those combinations and firsts the first k terms of each block, found one M^b apart.
+    # Without a modulus the combinations are exact Python integers.
+    dtype = np.int64 if modulus else object
+    b = max( k, math.isqrt( count ) )
+    rows = np.zeros( ( b, k ), dtype=dtype )
+    rows[ :k ] = np.eye( k, dtype=np.int64 )
+    for j in range( k, b ):
+        for i, c in enumerate( coefficients ):
+            if modulus:
+                rows[ j ] = ( rows[ j ] + c % modulus * rows[ j - 1 - i ] ) % modulus
+            else:
+                rows[ j ] = rows[ j ] + c * rows[ j - 1 - i ]
+        if not modulus and any( abs( x ) >> 1000 for x in rows[ j ] ):
+            # Keep blocks short enough that the combinations stay in float range
+            b = j
+            rows = rows[ :b ]
+            break
+    step = [ [ int( i == j ) for j in range( k ) ] for i in range( k ) ]
+    for bit in range( b.bit_length( ) ):
+        if b >> bit & 1:
+            step = matrix_multiply( companion_power( coefficients, modulus, bit ), step, modulus )
+    blocks = -( -count // b )
+    firsts = []
+    tail = []
+    current = state
+    for block in range( blocks ):
+        firsts.append( current[ ::-1 ] )
+        current = [ row[ 0 ] for row in matrix_multiply( step, [ [ x ] for x in current ], modulus ) ]
+        if not modulus and any( abs( x ) >> 1100 for x in current ):
+            # Everything after this is taken to be outside float range, so the integers stop growing.
+            # The state is carried on in floats, scaled back to at most 1, for the sign of those terms.
+            # Recurrences with complex dominant roots can swing back into range; those terms stay inf.
+            top = max( abs( x ).bit_length( ) for x in current )
+            direction = np.array( [ math.ldexp( x >> ( top - 60 ), -60 ) for x in current ] )
+            step_float = np.vectorize( float_or_inf, otypes=[ np.float64 ] )( np.array( step, dtype=object ) )
+            for _ in range( blocks - block - 1 ):
+                tail.append( direction[ ::-1 ] )
+                direction = step_float @ direction
+                direction /= np.abs( direction ).max( ) or 1.0
+            firsts += [ [ math.inf ] * k ] * len( tail )
+            break
+    firsts = np.array( firsts, dtype=object ).T
+
+    if modulus:
+        terms = np.zeros( ( b, blocks ), dtype=np.int64 )
+        firsts = firsts.astype( np.int64 )
+        for i in range( k ):
+            # Both factors are below the modulus, at most 2 ** 31, so each product fits in 63 bits
+            terms = ( terms + rows[ :, i:i + 1 ] * firsts[ i ] ) % modulus
+    else:
+        rows_float = rows.astype( np.float64 )
+        firsts_float = np.vectorize( float_or_inf, otypes=[ np.float64 ] )( firsts )
+        with np.errstate( over='ignore', invalid='ignore' ):
+            # Past float range, inf * 0 and inf - inf give nan; those terms overflowed too
+            terms = rows_float @ firsts_float
+            terms[ np.isnan( terms ) ] = np.inf
+            if tail:
+                # Terms the direction puts at exactly zero, like every other term of a( n ) = 2 a( n - 2 ),
+                # stay zero
+                signs = rows_float @ np.array( tail ).T
+                terms[ :, blocks - len( tail ): ] = np.where( signs == 0, 0.0, np.copysign( np.inf, signs ) )
+            # How far each float term can be from the exact one
+            error = ( np.abs( rows_float ) @ np.abs( firsts_float ) ) * ( ( k + 3 ) * 2.0 ** -52 )
+            beyond = ~np.isfinite( terms ) | ( np.abs( terms ) - error >= 2 ** 63 )
+        # The last block runs past the window; only terms inside it decide the type
+        inside = np.arange( b )[ :, None ] + np.arange( blocks ) * b < count
+        if not ( beyond & inside ).any( ):
+            # Every term may fit int64. int64 arithmetic wraps modulo 2 ** 64, so it is exact for
+            # any term that fits, however large the products along the way. Terms too close to
+            # the limit to tell are summed in Python integers.
+            exact = wrap_int64( rows ) @ wrap_int64( firsts )
+            unsure = np.flatnonzero( ( ( np.abs( terms ) + error >= 2 ** 63 ) & inside ).any( axis=0 ) )
+            if unsure.size:
+                checked = rows @ firsts[ :, unsure ]
+                if all( abs( x ) < 2 ** 63 for x in checked[ inside[ :, unsure ] ] ):
+                    exact[ :, unsure ] = wrap_int64( checked )
+                else:
+                    exact = None
+            if exact is not None:
+                terms = exact
+        if terms.dtype == np.float64:
+            # Near the top of float range a product can overflow while the term itself does not,
+            # which also loses its sign. Those blocks are summed in Python integers and rounded once.
+            with np.errstate( invalid='ignore' ):
+                # A nan bound comes from inf * 0 and says nothing, so it counts as too close too
+                edge = ( ~( np.abs( terms ) + error <= np.finfo( np.float64 ).max ) & inside ).any( axis=0 )
+            edge = np.flatnonzero( edge[ :blocks - len( tail ) ] )
+            if edge.size:
+                terms[ :, edge ] = np.vectorize( float_or_inf, otypes=[ np.float64 ] )( rows @ firsts[ :, edge ] )
+    return finish_recurrence( terms.T.ravel( )[ :count ], modulus )
+
+def wrap_int64( values ):
+    # Python integers as the int64 they are congruent to modulo 2 ** 64
+    return np.array( [ ( x + 2 ** 63 ) % 2 ** 64 - 2 ** 63 for x in values.ravel( ) ], dtype=np.int64 ).reshape( values.shape )
+
+def float_or_inf( x ):
+    try:
+        return float( x )
+    except OverflowError:
+        return math.inf if x > 0 else -math.inf
+
+def finish_recurrence( values, modulus ):
+    # Exact integers stay int64. Float results are already rounded and stay float64, with terms
+    # past float range as inf.
+    if isinstance( values, np.ndarray ):
+        return values
+    if modulus or all( abs( x ) < 2 ** 63 for x in values ):
+        return np.array( values, dtype=np.int64 )
+    return np.array( [ float_or_inf( x ) for x in values ], dtype=np.float64 )
+
+def chudnovsky( a, b ):
+    # Binary splitting of the Chudnovsky series over terms a to b - 1
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = ( 6 * a - 5 ) * ( 2 * a - 1 ) * ( 6 * a - 1 )
+            q = a * a * a * 10939058860032000
+        t = p * ( 13591409 + 545140134 * a )
+        return p, q, -t if a & 1 else t
+    m = ( a + b ) // 2
+    p1, q1, t1 = chudnovsky( a, m )
+    p2, q2, t2 = chudnovsky( m, b )
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+def factorial_series( a, b ):
+    # Binary splitting of sum 1 / ( ( a + 1 ) ... k ) for k in a + 1 to b
+    if b - a == 1:
+        return 1, b
+    m = ( a + b ) // 2
+    p1, q1 = factorial_series( a, m )
+    p2, q2 = factorial_series( m, b )
+    return p1 * q2 + p2, q1 * q2
+
+def scaled_constant( constant, digits ):
+    # floor( constant * 10 ** digits ), in integers only
+    scale = 10 ** digits
+    if constant == "pi":
+        _, q, t = chudnovsky( 0, digits // 14 + 2 )
+        return 426880 * math.isqrt( 10005 * scale * scale ) * q // t
+    if constant == "e":
+        terms = 2
+        while math.lgamma( terms + 1 ) < ( digits + 2 ) * math.log( 10 ):
+            terms *= 2
+        p, q = factorial_series( 0, terms )
+        return scale + scale * p // q
+    if constant == "sqrt(2)":
+        return math.isqrt( 2 * scale * scale )
+    return ( scale + math.isqrt( 5 * scale * scale ) ) // 2
+
+DIGIT_LIMIT = 100000
+GUARD_DIGITS = 10
+
+@functools.lru_cache( maxsize=4 )
+def constant_digits( constant, digits ):
+    # Decimal digits from the leading one on, computed with guard digits and cut back. Decimal
+    # converts the integer to text without int's digit limit.
+    text = str( decimal.Decimal( scaled_constant( constant, digits + GUARD_DIGITS ) ) )[ :digits ]
+    return np.frombuffer( text.encode( "ascii" ), dtype=np.uint8 ) - ord( "0" )
+
+def digit_terms( constant, start, count ):
+    if start + count > DIGIT_LIMIT:
+        raise ValueError( f"Warning: [IntSeqGenerator] Digits are available up to index {DIGIT_LIMIT:,}." )
+    # Round the length up so that growing windows reuse one expansion
+    digits = max( 1024, 1 << ( start + count - 1 ).bit_length( ) )
+    return constant_digits( constant, min( digits, DIGIT_LIMIT ) )[ start:start + count ].astype( np.int64 )
+
+GENERATORS = [ "primes", "fibonacci", "linear recurrence", "collatz steps", "digits", "recaman", "thue-morse" ]
+
+def generate_terms( kind, start, count, modulus=0, coefficients="1,1", initial="0,1", constant="pi" ):
+    if kind == "primes":
+        return prime_terms( start, count )
+    if kind == "fibonacci":
+        return recurrence_terms( ( 1, 1 ), ( 0, 1 ), modulus, start, count )
+    if kind == "linear recurrence":
+        c = tuple( parse_batch_list( coefficients, int, "coefficients", "IntSeqGenerator" ) )
+        a = parse_batch_list( initial, int, "initial", "IntSeqGenerator" )
+        if not c or len( a ) < len( c ):
+            raise ValueError( "Warning: [IntSeqGenerator] A recurrence needs at least one coefficient and as many initial values." )
+        return recurrence_terms( c, a[ :len( c ) ], modulus, start, count )
+    if kind == "collatz steps":
+        return collatz_terms( start, count )
+    if kind == "digits":
+        return digit_terms( constant, start, count )
+    if kind == "recaman":
+        return recaman_terms( start, count )
+    return thue_morse_terms( start, count )
+
+class IntSeqGenerator:
+    @classmethod
+    def INPUT_TYPES( cls ):
+        return {
+            "required": {
+                "kind": ( GENERATORS, { "default": "primes" } ),
+                "start": ( "INT", { "default": 0, "min": 0, "max": 1000000000, "step": 1, "tooltip": f"Index of the first term. Primes and Recaman terms are available up to index {TABLE_LIMIT:,}" } ),
+                "count": ( "INT", { "default": 100, "min": 1, "max": 10000000, "step": 1, "tooltip": "Number of terms" } ),
+            },
+            "optional": {
+                "modulus": ( "INT", { "default": 0, "min": 0, "max": 2147483647, "step": 1, "tooltip": "[Fibonacci/Recurrence] Reduce terms modulo this (0 for none; without it terms past float range become inf)" } ),
+                "coefficients": ( "STRING", { "default": "1,1", "tooltip": "[Recurrence] c1, ..., ck for a(n) = c1 a(n-1) + ... + ck a(n-k)" } ),
+                "initial": ( "STRING", { "default": "0,1", "tooltip": "[Recurrence] a(0), ..., a(k-1)" } ),
+                "constant": ( [ "pi", "e", "sqrt(2)", "golden ratio" ], { "default": "pi", "tooltip": f"[Digits] Constant whose decimal digits are generated, up to index {DIGIT_LIMIT:,}" } ),
+                "format_text": ( "BOOLEAN", { "default": True, "tooltip": "Also write the terms to the SEQUENCE text output; turn off for very long sequences" } ),
+            }
+        }
+
+    RETURN_TYPES = ( "STRING", "INTSEQ", )
+    RETURN_NAMES = ( "SEQUENCE", "INTSEQ", )
+    FUNCTION = "generate_sequence"
+    CATEGORY = "IntSeq/generator"
+
+    @cached_result( )
+    def generate_sequence( self, kind, start, count, modulus=0, coefficients="1,1", initial="0,1", constant="pi", format_text=True ):
+        values = generate_terms( kind, start, count, modulus, coefficients, initial, constant )
+        with NODE_STATS.phase( "convert" ):
+            return ( format_values( values ) if format_text else "", values, )
 
 # --- Node Mappings ---
 
 NODE_CLASS_MAPPINGS = {
     "IntSeqImage": IntSeqImage,
+    "IntSeqAutomaton": IntSeqAutomaton,
     "IntSeqSigmas": IntSeqSigmas,
     "SigmasToIntSeq": SigmasToIntSeq,
     "IntSeqPlotter": IntSeqPlotter,
-    "IntSeqWave": IntSeqWave
+    "IntSeqWave": IntSeqWave,
+    "IntSeqCacheStats": IntSeqCacheStats,
+    "IntSeqLoader": IntSeqLoader,
+    "IntSeqGenerator": IntSeqGenerator
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "IntSeqImage": "Integer Sequence Image",
+    "IntSeqAutomaton": "Integer Sequence Automaton",
     "IntSeqSigmas": "Integer Sequence Sigmas",
     "SigmasToIntSeq": "Sigmas to Integer Sequence",
     "IntSeqPlotter": "Integer Sequence Plotter",
-    "IntSeqWave": "Integer Sequence Wave"
-}
\ No newline at end of file
+    "IntSeqWave": "Integer Sequence Wave",
+    "IntSeqCacheStats": "Integer Sequence Cache Stats",
+    "IntSeqLoader": "Integer Sequence Loader",
+    "IntSeqGenerator": "Integer Sequence Generator"
+}
+
+# Timing wraps the whole node call, cache lookups included
+if NODE_STATS.enabled:
+    for name, node in NODE_CLASS_MAPPINGS.items( ):
+        setattr( node, node.FUNCTION, NODE_STATS.wrap( name, getattr( node, node.FUNCTION ) ) )
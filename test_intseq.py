@@ -0,0 +1,385 @@
+import math
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image, ImageDraw
+
+import intseq
+
+# Parity checks against the original per-pixel implementations, kept here as the reference
+
+@pytest.fixture( autouse=True )
+def no_result_cache( monkeypatch ):
+    monkeypatch.setattr( intseq.RESULT_CACHE, "memory_bytes", 0 )
+    monkeypatch.setattr( intseq.RESULT_CACHE, "directory", None )
+
+def image_args( width, height, sequence, method, **extra ):
+    args = dict( width=width, height=height, sequence=sequence, method=method, rule=30, color_offset=0.33, value_min=-1, value_max=-1, red_min=-1, red_max=-1, green_min=-1, green_max=-1, blue_min=-1, blue_max=-1, angle_scale=1.0, length_scale=10.0, line_width=1, start_x=0, start_y=0, boundary_behavior="clamp" )
+    args.update( extra )
+    return args
+
+def rendered( args ):
+    return np.round( intseq.IntSeqImage( ).generate_image( **args )[ 0 ][ 0 ].numpy( ) * 255 ).astype( np.uint8 )
+
+def reference_rgb( width, height, values, color_offset, lv, mv, lr, mr, lg, mg, lb, mb ):
+    outimage = Image.new( "RGB", ( width, height ), ( 0, 0, 0 ) )
+    value_index = 0
+    for y in range( height ):
+        for x in range( width ):
+            nv = values[ value_index % len( values ) ]
+            nv = intseq.clamp( nv, lv, mv )
+            nr = int( intseq.remap( nv, lv, mv, lr, mr ) )
+            ng = int( intseq.remap( ( nv + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lg, mg ) )
+            nb = int( intseq.remap( ( nv + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lb, mb ) )
+            outimage.putpixel( ( x, y ), ( nr, ng, nb ) )
+            value_index += 1
+    return np.asarray( outimage )
+
+def reference_automaton( width, height, values, rule, color0, color1 ):
+    outimage = Image.new( "RGB", ( width, height ), ( 0, 0, 0 ) )
+    rule_bits = format( rule, '08b' )
+    current_row = [ int( intseq.remap( values[ i % len( values ) ], min( values ), max( values ), 0, 1.99 ) ) % 2 for i in range( width ) ]
+    for y in range( height ):
+        next_row = [ 0 ] * width
+        for x in range( width ):
+            outimage.putpixel( ( x, y ), color1 if current_row[ x ] == 1 else color0 )
+            left = current_row[ ( x - 1 + width ) % width ]
+            right = current_row[ ( x + 1 ) % width ]
+            next_row[ x ] = int( rule_bits[ 7 - ( left * 4 + current_row[ x ] * 2 + right ) ] )
+        current_row = next_row
+    return np.asarray( outimage )
+
+@pytest.mark.parametrize( "seed", range( 8 ) )
+def test_rgb_matches_reference( seed ):
+    rng = np.random.default_rng( seed )
+    width, height = int( rng.integers( 8, 48 ) ), int( rng.integers( 8, 48 ) )
+    values = [ round( float( v ), 2 ) for v in rng.uniform( -40, 300, int( rng.integers( 1, 3000 ) ) ) ]
+    lv, mv = sorted( int( v ) for v in rng.integers( 0, 256, 2 ) )
+    mv += lv == mv
+    channels = [ int( v ) for v in rng.integers( 0, 256, 6 ) ]
+    color_offset = round( float( rng.uniform( 0, 1 ) ), 2 )
+    args = image_args( width, height, ",".join( map( str, values ) ), "RGB", color_offset=color_offset, value_min=lv, value_max=mv, red_min=channels[ 0 ], red_max=channels[ 1 ], green_min=channels[ 2 ], green_max=channels[ 3 ], blue_min=channels[ 4 ], blue_max=channels[ 5 ] )
+    assert np.array_equal( rendered( args ), reference_rgb( width, height, values, color_offset, lv, mv, *channels ) )
+
+def test_automaton_matches_reference_for_every_rule( ):
+    rng = np.random.default_rng( 0 )
+    values = [ float( v ) for v in rng.integers( 0, 100, 37 ) ]
+    sequence = ",".join( map( str, values ) )
+    for rule in range( 256 ):
+        expected = reference_automaton( 40, 24, values, rule, ( 10, 20, 30 ), ( 200, 150, 100 ) )
+        args = image_args( 40, 24, sequence, "cellular automaton", rule=rule, red_min=10, red_max=200, green_min=20, green_max=150, blue_min=30, blue_max=100 )
+        assert np.array_equal( rendered( args ), expected ), f"rule {rule}"
+
+def reference_turtle( width, height, values, method, lv, mv, angle_scale, length_scale, line_width, start_x, start_y, boundary_behavior ):
+    outimage = Image.new( "RGB", ( width, height ), ( 0, 0, 0 ) )
+    draw = ImageDraw.Draw( outimage )
+    current_angle = 0.0
+    for i in range( 0, len( values ) - 1, 2 ):
+        segment_length = values[ i ] * length_scale
+        turn_angle = values[ i + 1 ] * angle_scale
+        if method == "angle and length":
+            current_angle += turn_angle
+            nv = intseq.clamp( values[ i + 1 ], lv, mv )
+        else:
+            current_angle = intseq.remap( turn_angle, lv, mv, 0, 360 )
+            nv = intseq.clamp( values[ i ], lv, mv )
+        line_color = ( int( intseq.remap( nv, lv, mv, lv, mv ) ), int( intseq.remap( ( nv + 0.33 * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lv, mv ) ), int( intseq.remap( ( nv + 2 * 0.33 * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lv, mv ) ) )
+        rad_angle = math.radians( current_angle )
+        end_x = start_x + segment_length * math.cos( rad_angle )
+        end_y = start_y + segment_length * math.sin( rad_angle )
+        draw.line( [ ( start_x, start_y ), ( end_x, end_y ) ], fill=line_color, width=line_width )
+        if boundary_behavior == "clamp":
+            start_x, start_y = intseq.clamp( end_x, 0, width - 1 ), intseq.clamp( end_y, 0, height - 1 )
+        elif boundary_behavior == "wrap":
+            start_x, start_y = end_x % width, end_y % height
+        elif boundary_behavior == "bounce" and not ( 0 <= end_x < width and 0 <= end_y < height ):
+            # Reflects the heading; run and turn sets a new heading every segment, so it only clamps
+            if not 0 <= end_x < width:
+                current_angle = 180 - current_angle
+            if not 0 <= end_y < height:
+                current_angle = 360 - current_angle
+            start_x, start_y = intseq.clamp( end_x, 0, width - 1 ), intseq.clamp( end_y, 0, height - 1 )
+        else:
+            start_x, start_y = end_x, end_y
+    return np.asarray( outimage )
+
+@pytest.mark.parametrize( "sequence, length_scale", [
+    ( "1,20,2,45,3,90,5,7", 10.0 ),
+    # End points beyond 2^29 still draw with their own slope
+    ( "5000000,10", 200.0 ),
+    ( "10000000,20", 100.0 ),
+    ( "6132402,2281178,43,26,34,3898798", 200.0 ),
+] )
+def test_angle_and_length_matches_pil( sequence, length_scale ):
+    values = [ float( x ) for x in sequence.split( "," ) ]
+    expected = reference_turtle( 512, 512, values, "angle and length", 0, 255, 1.0, length_scale, 1, 256, 256, "none" )
+    assert np.array_equal( rendered( image_args( 512, 512, sequence, "angle and length", length_scale=length_scale, start_x=256, start_y=256, boundary_behavior="none" ) ), expected )
+
+@pytest.mark.parametrize( "seed", range( 32 ) )
+def test_turtle_methods_match_pil( seed ):
+    rng = np.random.default_rng( seed )
+    method = ( "angle and length", "run and turn" )[ seed % 2 ]
+    boundary_behavior = ( "clamp", "wrap", "bounce", "none" )[ seed // 2 % 4 ]
+    line_width = ( 1, 2, 3, 6 )[ seed // 8 ]
+    width, height = int( rng.integers( 64, 160 ) ), int( rng.integers( 64, 160 ) )
+    lv, mv = ( 0, 255 ) if seed % 3 else ( 20, 200 )
+    values = [ round( float( v ), 1 ) for v in rng.uniform( 0, 255, 2 * int( rng.integers( 1, 40 ) ) ) ]
+    angle_scale, length_scale = round( float( rng.uniform( -3, 3 ) ), 1 ), round( float( rng.uniform( -2, 2 ) ), 1 )
+    start_x, start_y = int( rng.integers( 0, width ) ), int( rng.integers( 0, height ) )
+    expected = reference_turtle( width, height, values, method, lv, mv, angle_scale, length_scale, line_width, start_x, start_y, boundary_behavior )
+    args = image_args( width, height, ",".join( map( str, values ) ), method, value_min=lv, value_max=mv, angle_scale=angle_scale, length_scale=length_scale, line_width=line_width, start_x=start_x, start_y=start_y, boundary_behavior=boundary_behavior )
+    assert np.array_equal( rendered( args ), expected )
+
+def reference_meander( width, height, values, color_offset, lv, mv, length_scale, start_x, start_y, boundary_behavior ):
+    outimage = Image.new( "RGB", ( width, height ), ( 0, 0, 0 ) )
+    moves = [ ( 0, -1 ), ( 1, -1 ), ( 1, 0 ), ( 1, 1 ), ( 0, 1 ), ( -1, 1 ), ( -1, 0 ), ( -1, -1 ) ]
+    current_x, current_y = start_x, start_y
+    for i in values:
+        color_val = intseq.clamp( i, lv, mv )
+        nr = int( intseq.remap( color_val, lv, mv, lv, mv ) )
+        ng = int( intseq.remap( ( color_val + color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lv, mv ) )
+        nb = int( intseq.remap( ( color_val + 2 * color_offset * ( mv - lv ) ) % ( mv - lv + 1 ) + lv, lv, mv, lv, mv ) )
+        direction = int( intseq.remap( i, lv, mv, 0, 7 ) )
+        if 0 <= direction <= 7:
+            current_x += moves[ direction ][ 0 ] * length_scale
+            current_y += moves[ direction ][ 1 ] * length_scale
+        draw_x, draw_y = current_x, current_y
+        if boundary_behavior == "clamp":
+            draw_x, draw_y = intseq.clamp( current_x, 0, width - 1 ), intseq.clamp( current_y, 0, height - 1 )
+        elif boundary_behavior == "wrap":
+            draw_x, draw_y = current_x % width, current_y % height
+        elif boundary_behavior == "bounce":
+            # The original only draws the clamped point when y left the image; leaving only in x skips the pixel
+            if not 0 <= current_x < width:
+                current_x = intseq.clamp( current_x, 0, width - 1 )
+            if not 0 <= current_y < height:
+                current_y = intseq.clamp( current_y, 0, height - 1 )
+                draw_x, draw_y = current_x, current_y
+        if 0 <= draw_x < width and 0 <= draw_y < height:
+            outimage.putpixel( ( int( draw_x ), int( draw_y ) ), ( nr, ng, nb ) )
+    return np.asarray( outimage )
+
+@pytest.mark.parametrize( "seed", range( 16 ) )
+def test_meander_matches_reference( seed ):
+    rng = np.random.default_rng( seed )
+    boundary_behavior = ( "clamp", "wrap", "bounce", "none" )[ seed % 4 ]
+    width, height = int( rng.integers( 16, 64 ) ), int( rng.integers( 16, 64 ) )
+    lv, mv = ( 0, 255 ) if seed % 3 else ( 30, 180 )
+    values = [ round( float( v ), 1 ) for v in rng.uniform( -20, 275, int( rng.integers( 1, 3000 ) ) ) ]
+    length_scale = ( 1.0, 2.0, 0.5, -1.5 )[ seed // 4 ]
+    color_offset = round( float( rng.uniform( 0, 1 ) ), 2 )
+    start_x, start_y = int( rng.integers( 0, width ) ), int( rng.integers( 0, height ) )
+    expected = reference_meander( width, height, values, color_offset, lv, mv, length_scale, start_x, start_y, boundary_behavior )
+    args = image_args( width, height, ",".join( map( str, values ) ), "meander", color_offset=color_offset, value_min=lv, value_max=mv, length_scale=length_scale, start_x=start_x, start_y=start_y, boundary_behavior=boundary_behavior )
+    assert np.array_equal( rendered( args ), expected )
+
+@pytest.mark.parametrize( "tier", [ "memory", "disk" ] )
+def test_cache_hits_do_not_alias_the_cached_tensor( monkeypatch, tmp_path, tier ):
+    cache = intseq.ResultCache( 1 << 30 ) if tier == "memory" else intseq.ResultCache( 0, str( tmp_path ) )
+    monkeypatch.setattr( intseq, "RESULT_CACHE", cache )
+    args = image_args( 64, 48, "1,20,200,45,3", "RGB" )
+    computed = intseq.IntSeqImage( ).generate_image( **args )[ 0 ]
+    expected = computed.clone( )
+    computed.fill_( 0.5 )
+    for _ in range( 2 ):
+        hit = intseq.IntSeqImage( ).generate_image( **args )[ 0 ]
+        assert torch.equal( hit, expected )
+        if tier == "memory":
+            assert hit.data_ptr( ) != next( iter( cache.entries.values( ) ) )[ 0 ][ 0 ].data_ptr( )
+        hit.fill_( 0.25 )
+    assert cache.counters[ "hits" if tier == "memory" else "disk_hits" ] == 2
+
+@pytest.mark.parametrize( "method", [ "RGB", "cellular automaton", "angle and length", "run and turn", "meander" ] )
+def test_batch_images_match_single_renders( method ):
+    sequences = [ "1,20,2,45,3,90,5,7", "200,13,77,4,150", "9,250,31" ]
+    rules, offsets = [ 30, 90, 110 ], [ 0.1, 0.5, 0.9 ]
+    batch = intseq.IntSeqImage( ).generate_image( **image_args( 96, 64, "\n".join( sequences ), method, start_x=48, start_y=32, batch_separator="newline", rules="30,90,110", color_offsets="0.1,0.5,0.9" ) )[ 0 ]
+    assert batch.shape[ 0 ] == len( sequences )
+    for b, sequence in enumerate( sequences ):
+        single = intseq.IntSeqImage( ).generate_image( **image_args( 96, 64, sequence, method, rule=rules[ b ], color_offset=offsets[ b ], start_x=48, start_y=32 ) )[ 0 ]
+        assert np.array_equal( batch[ b ].numpy( ), single[ 0 ].numpy( ) ), f"image {b}"
+
+def test_parse_cache_is_bounded_by_bytes( ):
+    cache = intseq.ParseCache( 4000 )
+    small = ",".join( map( str, range( 20 ) ) )
+    assert cache.get_or_parse( small, intseq.read_values ) is cache.get_or_parse( small, intseq.read_values )
+    large = ",".join( map( str, range( 200 ) ) )
+    assert cache.get_or_parse( large, intseq.read_values ) is not cache.get_or_parse( large, intseq.read_values )
+    for n in range( 30, 60 ):
+        cache.get_or_parse( ",".join( map( str, range( n ) ) ), intseq.read_values )
+    assert cache.size == sum( size for _, size in cache.entries.values( ) ) <= 4000
+    assert small not in cache.entries
+
+def test_wave_text_output_is_optional( ):
+    args = ( "sine", 1000, 2.0, 3.0, 10.0, 0.5, 0.0, 0.0 )
+    text, values = intseq.IntSeqWave( ).generate_wave_sequence( *args )
+    empty, same = intseq.IntSeqWave( ).generate_wave_sequence( *args, format_text=False )
+    assert empty == "" and np.array_equal( values, same )
+    assert np.array_equal( intseq.parse_values( text ), values )
+
+def brute_primes( count ):
+    limit = 16
+    while True:
+        sieve = np.ones( limit, dtype=bool )
+        sieve[ :2 ] = False
+        for p in range( 2, math.isqrt( limit ) + 1 ):
+            if sieve[ p ]:
+                sieve[ p * p::p ] = False
+        primes = np.flatnonzero( sieve )
+        if len( primes ) >= count:
+            return primes[ :count ].tolist( )
+        limit *= 2
+
+def test_prime_windows_in_any_order( monkeypatch ):
+    monkeypatch.setattr( intseq, "PRIMES", intseq.PrimeTable( ) )
+    expected = brute_primes( 250000 )
+    for start, count in [ ( 200000, 50000 ), ( 0, 10 ), ( 5, 1 ), ( 1000, 5000 ), ( 70000, 3 ), ( 0, 250000 ) ]:
+        assert intseq.generate_terms( "primes", start, count ).tolist( ) == expected[ start:start + count ]
+
+def brute_recurrence( coefficients, initial, count ):
+    terms = list( initial[ :len( coefficients ) ] )
+    while len( terms ) < count:
+        terms.append( sum( c * terms[ -1 - i ] for i, c in enumerate( coefficients ) ) )
+    return terms[ :count ]
+
+def assert_recurrence_window( got, exact, modulus ):
+    # int64 whenever every term fits, otherwise float64 close to the exact terms
+    if modulus:
+        assert got.dtype == np.int64 and got.tolist( ) == [ x % modulus for x in exact ]
+    elif all( abs( x ) < 2 ** 63 for x in exact ):
+        assert got.dtype == np.int64 and got.tolist( ) == exact
+    else:
+        expected = np.array( [ intseq.float_or_inf( x ) for x in exact ] )
+        scale = np.abs( expected[ np.isfinite( expected ) ] ).max( initial=1.0 )
+        assert got.dtype == np.float64 and np.allclose( got, expected, rtol=1e-9, atol=1e-9 * scale )
+
+@pytest.mark.parametrize( "start, count, modulus", [ ( 0, 93, 0 ), ( 0, 94, 0 ), ( 50, 40, 0 ), ( 85, 2, 0 ), ( 92, 1, 0 ), ( 93, 1, 0 ), ( 60, 500, 0 ), ( 1400, 200, 0 ), ( 0, 3000, 1000000007 ), ( 2500, 700, 97 ) ] )
+def test_fibonacci_matches_brute_force( start, count, modulus ):
+    exact = brute_recurrence( ( 1, 1 ), ( 0, 1 ), start + count )[ start: ]
+    assert_recurrence_window( intseq.generate_terms( "fibonacci", start, count, modulus ), exact, modulus )
+
+@pytest.mark.parametrize( "seed", range( 40 ) )
+def test_linear_recurrence_matches_brute_force( seed ):
+    rng = np.random.default_rng( seed )
+    k = int( rng.integers( 1, 5 ) )
+    coefficients = [ int( c ) for c in rng.integers( -3, 4, k ) ]
+    initial = [ int( a ) for a in rng.integers( -5, 6, k ) ]
+    start, count = int( rng.integers( 0, 200 ) ), int( rng.integers( 1, 400 ) )
+    modulus = ( 0, 0, 97, 2147483647 )[ seed % 4 ]
+    exact = brute_recurrence( coefficients, initial, start + count )[ start: ]
+    got = intseq.generate_terms( "linear recurrence", start, count, modulus, ",".join( map( str, coefficients ) ), ",".join( map( str, initial ) ) )
+    assert_recurrence_window( got, exact, modulus )
+
+@pytest.mark.parametrize( "coefficients, initial, start, count", [
+    # Products overflow float while the terms are still in range, and terms leave it with their sign
+    ( "-3,2,-2,1", "1,-5,-2,-3", 180, 383 ),
+    ( "1,1", "0,-1", 0, 3000 ),
+    # Every other term is zero, far past float range too
+    ( "0,2", "0,4", 0, 3000 ),
+] )
+def test_recurrence_terms_near_and_past_float_range( coefficients, initial, start, count ):
+    c, a = [ int( x ) for x in coefficients.split( "," ) ], [ int( x ) for x in initial.split( "," ) ]
+    exact = brute_recurrence( c, a, start + count )[ start: ]
+    assert_recurrence_window( intseq.generate_terms( "linear recurrence", start, count, 0, coefficients, initial ), exact, 0 )
+
+def test_recurrence_far_windows_with_a_modulus( ):
+    # Past the start limit a modulus is required; overlapping windows must agree and obey the recurrence
+    modulus = 1000000007
+    with pytest.raises( ValueError ):
+        intseq.generate_terms( "fibonacci", 10 ** 9, 10 )
+    window = intseq.generate_terms( "fibonacci", 10 ** 9, 50, modulus ).tolist( )
+    assert intseq.generate_terms( "fibonacci", 10 ** 9 + 20, 30, modulus ).tolist( ) == window[ 20: ]
+    assert all( window[ i ] == ( window[ i - 1 ] + window[ i - 2 ] ) % modulus for i in range( 2, 50 ) )
+
+def brute_collatz( n ):
+    steps = 0
+    while n != 1:
+        n = 3 * n + 1 if n & 1 else n // 2
+        steps += 1
+    return steps
+
+@pytest.mark.parametrize( "start, count", [ ( 0, 3000 ), ( 99990, 40 ), ( ( 1 << 24 ) - 20, 60 ), ( 10 ** 9, 100 ) ] )
+def test_collatz_matches_brute_force( start, count ):
+    assert intseq.generate_terms( "collatz steps", start, count ).tolist( ) == [ brute_collatz( n + 1 ) for n in range( start, start + count ) ]
+
+def test_recaman_windows_in_any_order( monkeypatch ):
+    monkeypatch.setattr( intseq, "RECAMAN", intseq.RecamanTable( ) )
+    expected, seen = [ 0 ], { 0 }
+    for n in range( 1, 20000 ):
+        value = expected[ -1 ] - n if expected[ -1 ] - n > 0 and expected[ -1 ] - n not in seen else expected[ -1 ] + n
+        expected.append( value )
+        seen.add( value )
+    for start, count in [ ( 15000, 5000 ), ( 0, 20 ), ( 3, 1 ), ( 1000, 9000 ) ]:
+        assert intseq.generate_terms( "recaman", start, count ).tolist( ) == expected[ start:start + count ]
+
+@pytest.mark.parametrize( "start", [ 0, 1000, 2 ** 40 - 7 ] )
+def test_thue_morse_matches_bit_parity( start ):
+    assert intseq.generate_terms( "thue-morse", start, 500 ).tolist( ) == [ bin( n ).count( "1" ) % 2 for n in range( start, start + 500 ) ]
+
+@pytest.mark.parametrize( "constant, digits", [
+    ( "pi", "314159265358979323846264338327950288419716939937510" ),
+    ( "e", "271828182845904523536028747135266249775724709369995" ),
+    ( "sqrt(2)", "141421356237309504880168872420969807856967187537694" ),
+    ( "golden ratio", "161803398874989484820458683436563811772030917980576" ),
+] )
+def test_first_digits_of_each_constant( constant, digits ):
+    assert intseq.generate_terms( "digits", 0, len( digits ), constant=constant ).tolist( ) == [ int( d ) for d in digits ]
+    # Windows past the first expansion agree with a longer one
+    assert intseq.generate_terms( "digits", 1020, 10, constant=constant ).tolist( ) == intseq.generate_terms( "digits", 0, 3000, constant=constant )[ 1020:1030 ].tolist( )
+
+@pytest.mark.parametrize( "kind, start", [ ( "primes", intseq.TABLE_LIMIT ), ( "recaman", intseq.TABLE_LIMIT ), ( "digits", intseq.DIGIT_LIMIT ) ] )
+def test_generator_limits( kind, start ):
+    with pytest.raises( ValueError ):
+        intseq.generate_terms( kind, start - 5, 10 )
+
+@pytest.mark.parametrize( "method, line_width", [ ( "RGB", 1 ), ( "cellular automaton", 1 ), ( "angle and length", 1 ), ( "angle and length", 4 ), ( "run and turn", 1 ), ( "meander", 1 ) ] )
+def test_last_frame_matches_single_render( method, line_width ):
+    args = image_args( 96, 64, "1,20,2,45,3,90,5,7,200,13,77,4,150,9", method, line_width=line_width, start_x=48, start_y=32 )
+    single = intseq.IntSeqImage( ).generate_image( **args )[ 0 ]
+    frames = intseq.IntSeqImage( ).generate_image( **args, frames=5 )[ 0 ]
+    assert frames.shape[ 0 ] == 5
+    assert np.array_equal( frames[ -1 ].numpy( ), single[ 0 ].numpy( ) )
+    # Earlier frames show only part of it
+    assert not np.array_equal( frames[ 0 ].numpy( ), frames[ -1 ].numpy( ) )
+
+def reference_life( grid, birth, survive, radius, generations, age ):
+    ages = grid.astype( np.int64 )
+    for _ in range( generations ):
+        counts = sum( np.roll( grid, ( dy, dx ), axis=( 0, 1 ) ).astype( np.int64 ) for dy in range( -radius, radius + 1 ) for dx in range( -radius, radius + 1 ) ) - grid
+        alive = grid.astype( bool )
+        grid = ( ( ~alive & np.isin( counts, list( birth ) ) ) | ( alive & np.isin( counts, list( survive ) ) ) ).astype( np.uint8 )
+        ages = ( ages + 1 ) * grid
+    return ages if age else grid
+
+@pytest.mark.parametrize( "rule, birth, survive, radius", [
+    ( "B3/S23", { 3 }, { 2, 3 }, 1 ),
+    ( "B36/S125", { 3, 6 }, { 1, 2, 5 }, 1 ),
+    ( "B7-9/S6-11", set( range( 7, 10 ) ), set( range( 6, 12 ) ), 2 ),
+    ( "B14-19/S13-25", set( range( 14, 20 ) ), set( range( 13, 26 ) ), 3 ),
+    ( "B34-45/S33-57", set( range( 34, 46 ) ), set( range( 33, 58 ) ), 5 ),
+] )
+@pytest.mark.parametrize( "workers", [ 1, 4 ] )
+@pytest.mark.parametrize( "age", [ False, True ] )
+def test_life_matches_roll_reference( rule, birth, survive, radius, workers, age ):
+    grid = ( np.random.default_rng( radius ).random( ( 67, 83 ) ) < 0.4 ).astype( np.uint8 )
+    expected = reference_life( grid, birth, survive, radius, 7, age )
+    got = intseq.run_life( grid.copy( ), *intseq.parse_life_rule( rule, radius ), radius, 7, age, workers )
+    assert np.array_equal( got, expected )
+
+def reference_totalistic( row, table, radius, height, age ):
+    rows, ages = [], ( row > 0 ).astype( np.int64 )
+    current = row.astype( np.int64 )
+    for y in range( height ):
+        if y:
+            current = table[ sum( np.roll( current, shift ) for shift in range( -radius, radius + 1 ) ) ].astype( np.int64 )
+            ages = ( ages + 1 ) * ( current > 0 )
+        rows.append( ages.copy( ) if age else current )
+    return np.array( rows )
+
+@pytest.mark.parametrize( "rule, states, radius", [ ( "10", 2, 1 ), ( "150", 2, 3 ), ( "1599", 3, 1 ), ( "100003", 3, 2 ), ( "555555", 4, 1 ) ] )
+@pytest.mark.parametrize( "age", [ False, True ] )
+def test_totalistic_matches_roll_reference( rule, states, radius, age ):
+    row = np.random.default_rng( states ).integers( 0, states, 101 ).astype( np.uint8 )
+    table = intseq.parse_totalistic_rule( rule, states, radius )
+    assert np.array_equal( intseq.run_totalistic( row, table, radius, 60, age ), reference_totalistic( row, table, radius, 60, age ) )